@@ -32,8 +32,7 @@
 
 """
 
-from typing import Any, List, Optional, Tuple
-from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from islenska.basics import make_bin_entry, ALL_CASES
 from islenska.bindb import GreynirBin as GBin, PERSON_NAME_FL
@@ -46,8 +45,20 @@ from .settings import StaticPhrases
 ResultTuple = Tuple[str, List[BIN_Tuple]]
 
 
-# Size of name cache for lookup_name_gender
-_NAME_GENDER_CACHE_SIZE = 128
+# Size of each of the name gender caches for lookup_name_gender
+_NAME_GENDER_CACHE_SIZE = 4096
+
+
+def _bin_tuples(
+    entries: Iterable[Tuple[str, int, str, str, str, str]]
+) -> List[BIN_Tuple]:
+    """Convert islenska.BinEntry instances to BIN_Tuple instances"""
+    # Unpacking positionally avoids the generic iterable handling
+    # in BIN_Tuple._make()
+    return [
+        BIN_Tuple(stofn, utg, ordfl, fl, ordmynd, beyging)
+        for stofn, utg, ordfl, fl, ordmynd, beyging in entries
+    ]
 
 
 class GreynirBin(GBin):
@@ -57,6 +68,12 @@ class GreynirBin(GBin):
 
     _singleton: Optional["GreynirBin"] = None
 
+    # Name gender caches for lookup_name_gender(), shared by all instances.
+    # The keys include the class, so that subclasses that override
+    # meanings() do not share entries with GreynirBin itself.
+    _FIRST_NAME_GENDERS: Dict[Tuple[type, str, str], Optional[str]] = {}
+    _FULL_NAME_GENDERS: Dict[Tuple[type, str, str], str] = {}
+
     @classmethod
     def get_db(cls) -> "GreynirBin":
         if cls._singleton is None:
@@ -82,23 +99,23 @@ class GreynirBin(GBin):
             self._meanings_cache_lookup,
             make_bin_entry,
         )
-        return w, [BIN_Tuple._make(mm) for mm in m]
+        return w, _bin_tuples(m)
 
     def lookup_nominative_g(self, w: str, **options: Any) -> List[BIN_Tuple]:
         """Returns the Greynir version of islenska.BinEntry"""
-        return [BIN_Tuple._make(mm) for mm in super().lookup_nominative(w, **options)]
+        return _bin_tuples(super().lookup_nominative(w, **options))
 
     def lookup_accusative_g(self, w: str, **options: Any) -> List[BIN_Tuple]:
         """Returns the Greynir version of islenska.BinEntry"""
-        return [BIN_Tuple._make(mm) for mm in super().lookup_accusative(w, **options)]
+        return _bin_tuples(super().lookup_accusative(w, **options))
 
     def lookup_dative_g(self, w: str, **options: Any) -> List[BIN_Tuple]:
         """Returns the Greynir version of islenska.BinEntry"""
-        return [BIN_Tuple._make(mm) for mm in super().lookup_dative(w, **options)]
+        return _bin_tuples(super().lookup_dative(w, **options))
 
     def lookup_genitive_g(self, w: str, **options: Any) -> List[BIN_Tuple]:
         """Returns the Greynir version of islenska.BinEntry"""
-        return [BIN_Tuple._make(mm) for mm in super().lookup_genitive(w, **options)]
+        return _bin_tuples(super().lookup_genitive(w, **options))
 
     def meanings(self, w: str) -> List[BIN_Tuple]:
         """Low-level lookup of BIN_Tuple instances for the given word"""
@@ -107,32 +124,63 @@ class GreynirBin(GBin):
             for k in self._ksnid_lookup(w)
         ]
 
-    @lru_cache(maxsize=_NAME_GENDER_CACHE_SIZE)
-    def lookup_name_gender(self, name: str, preferred_case: str = "nf") -> str:
-        """Given a person name, lookup its gender"""
-        assert preferred_case in ALL_CASES
-
-        if not name:
-            return "hk"  # Unknown gender
-
-        w = name.split(maxsplit=1)[0]  # Get first name
+    def _first_name_gender(self, w: str, preferred_case: str) -> Optional[str]:
+        """Return the gender of the given first name, or None if it is
+        not found as a person name in BÍN. The result is cached on the
+        first name only, not on the entire name, since the rest of the
+        name is not looked up in BÍN."""
+        key = (type(self), w, preferred_case)
+        try:
+            return self._FIRST_NAME_GENDERS[key]
+        except KeyError:
+            pass
+        gender: Optional[str] = None
         m = self.meanings(w)  # Look up meanings
         if m:
             # Find all meanings that can be person names
             nl = [x for x in m if x.fl in PERSON_NAME_FL]
             if nl:
-                # Find all meanings in the preferred case
-                prefc = [x for x in nl if x.beyging.lower().startswith(preferred_case)]
+                # Find all meanings in the preferred case, using a slice
+                # comparison instead of lower() + startswith()
+                case = preferred_case.upper()
+                clen = len(case)
+                prefc = [x for x in nl if x.beyging[:clen] == case]
                 if prefc:
                     # Found a name meaning in the preferred case
-                    return prefc[0].ordfl
-                # Found a name meaning *not* in the preferred case
-                return nl[0].ordfl
+                    gender = prefc[0].ordfl
+                else:
+                    # Found a name meaning *not* in the preferred case
+                    gender = nl[0].ordfl
+        if len(self._FIRST_NAME_GENDERS) >= _NAME_GENDER_CACHE_SIZE:
+            self._FIRST_NAME_GENDERS.clear()
+        self._FIRST_NAME_GENDERS[key] = gender
+        return gender
+
+    def lookup_name_gender(self, name: str, preferred_case: str = "nf") -> str:
+        """Given a person name, lookup its gender"""
+        assert preferred_case in ALL_CASES
+
+        if not name:
+            return "hk"  # Unknown gender
+
+        # Look up the first name (this is cached per first name and case)
+        gender = self._first_name_gender(name.split(maxsplit=1)[0], preferred_case)
+        if gender is not None:
+            return gender
 
         # The first name was not found: check whether the full name is
         # in the static phrases
+        key = (type(self), name, preferred_case)
+        try:
+            return self._FULL_NAME_GENDERS[key]
+        except KeyError:
+            pass
+        gender = "hk"  # Unknown gender
         m = StaticPhrases.lookup(name)
         if m is not None:
             if m.fl in PERSON_NAME_FL:
-                return m.ordfl
-        return "hk"  # Unknown gender
+                gender = m.ordfl
+        if len(self._FULL_NAME_GENDERS) >= _NAME_GENDER_CACHE_SIZE:
+            self._FULL_NAME_GENDERS.clear()
+        self._FULL_NAME_GENDERS[key] = gender
+        return gender
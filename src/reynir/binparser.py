@@ -49,6 +49,7 @@ from typing import (
     Dict,
     Mapping,
     Set,
+    FrozenSet,
     Tuple,
     List,
     Union,
@@ -64,7 +65,8 @@ import time
 import re
 
 from datetime import datetime
-from functools import reduce, lru_cache
+from functools import partial, reduce, lru_cache
+from operator import itemgetter
 import json
 import importlib.metadata
 
@@ -111,6 +113,11 @@ _PATH = os.path.dirname(__file__)
 
 MatcherFunc = Callable[["BIN_Token", "BIN_Terminal", BIN_Tuple], bool]
 
+# JSON encoder for BIN_Token.dump(). Calling json.dumps() with a non-default
+# argument such as ensure_ascii=False constructs a new encoder on every call,
+# so we create one up front and reuse it.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 class WordMatchers:
     """A namespace to enclose the matching functions for various
@@ -147,7 +154,7 @@ class WordMatchers:
         # the last part in lookups in the internal verb dictionaries.
         verb = m.stofn
         if "-" in verb:
-            verb = verb.rsplit("-", maxsplit=1)[-1]
+            verb = verb.rpartition("-")[2]
         # TODO: Remove the following cast when Pylance learns to handle @lru_cache()
         return token.verb_matches(verb, terminal, m.beyging)
 
@@ -165,68 +172,63 @@ class WordMatchers:
         if m.fl == "nafn" or m.fl == "ætt":
             # Names or family names (ættarnöfn) are only matched by person terminals
             return False
-        for v in terminal.variants:
-            if v in BIN_Token.GENDERS_SET:
-                if m.ordfl != v:
-                    # Mismatched gender
-                    return False
-            elif v[0] == "x":
+        gender = terminal.gender_vbits
+        if gender and gender != BIN_Token.VBIT[m.ordfl]:
+            # Mismatched gender
+            return False
+        if terminal.has_any_vbits(BIN_Token.VBIT_ENDING):
+            # Only a handful of noun terminals have ending constraints,
+            # so skip both loops with a single bit test for the rest
+            for ending in terminal.lemma_endings:
                 # Variants starting with 'x' specify a stem ending match.
                 # For example 'xir' matches only lemmas that end with 'ir',
                 # such as 'læknir', 'kælir'
-                if not m.stofn.endswith(v[1:]):
+                if not m.stofn.endswith(ending):
                     return False
-            elif v[0] == "z":
+            for ending in terminal.word_endings:
                 # Variants starting with 'z' specify a word form ending match.
                 # For example 'zana' matches only words that end with 'ana',
                 # such as 'þingflokkana', 'karlana'
-                if not token.t1_lower.endswith(v[1:]):
-                    return False
-            elif no_info:
-                # No case and number info: probably a foreign word
-                # Match all cases and numbers
-                # if v == "ft":
-                #    return False
-                if v == "gr":
-                    # Do not match a demand for the definitive article ('greinir')
+                if not token.t1_lower.endswith(ending):
                     return False
-            else:
-                bin_string = BIN_Token.VARIANT.get(v)
-                if bin_string and bin_string not in m.beyging:
-                    # Required case or number not found: no match
-                    return False
-        return True
+        if no_info:
+            # No case and number info: probably a foreign word
+            # Match all cases and numbers, but do not match a demand
+            # for the definitive article ('greinir')
+            return not terminal.has_vbits(BIN_Token.VBIT_GR)
+        # Check that the required case, number and definite article are
+        # present in the meaning (the gender has already been checked).
+        # Note that the terminal's fbits exclude the FBIT_MASK variants
+        # (abbrev, subj, expl, scases and endings), so those are never
+        # required to be present in the BÍN beyging string.
+        return terminal.fbits_match_mask(
+            BIN_Token.VBIT_NOT_GENDERS, BIN_Token.get_fbits(m.beyging)
+        )
 
     @staticmethod
     def matcher_lo(token: "BIN_Token", terminal: "BIN_Terminal", m: BIN_Tuple) -> bool:
         """Match word with adjective terminal, i.e. lo_xxx"""
         if m.ordfl != "lo":
             return False
-        if terminal.has_any_vbits(BIN_Token.VBIT_SCASES):
+        scase = terminal.subject_case
+        if scase is not None:
             # The terminal demands an adjective that can accept a
             # subject in a particular case ('samþykkur Páli')
-            if terminal.has_variant("sþf"):
-                scase = "þf"
-            elif terminal.has_variant("sþgf"):
-                scase = "þgf"
-            elif terminal.has_variant("sef"):
-                scase = "ef"
-            else:
-                # Note that nominative ('snf'/'nf') is not allowed here
-                assert False, "Unknown subject case for adjective"
             # Decompose compound word
-            lastpart = m.stofn.rsplit("-", maxsplit=1)[-1]
-            scases = token._ADJ_ARGUMENTS.get(lastpart, set())
-            if scase not in scases:
+            lastpart = m.stofn
+            if "-" in lastpart:
+                lastpart = lastpart.rpartition("-")[2]
+            if scase not in token._ADJ_ARGUMENTS.get(lastpart, ()):
                 # This adjective cannot take an argument in the given case
                 return False
         if terminal.has_any_vbits(BIN_Token.VBIT_ENDING):
             # The terminal has a word or lemma ending constraint,
             # such as _zlega: we don't match unless the meaning is compatible
-            for v in terminal.variants:
-                if v[0] == "z" and not m.ordmynd.endswith(v[1:]):
+            for ending in terminal.word_endings:
+                if not m.ordmynd.endswith(ending):
                     return False
-                elif v[0] == "x" and not m.stofn.endswith(v[1:]):
+            for ending in terminal.lemma_endings:
+                if not m.stofn.endswith(ending):
                     return False
         if m.beyging == "-":
             # Abbreviations for adjectives have no declension info,
@@ -255,9 +257,7 @@ class WordMatchers:
         fbits = BIN_Token.get_fbits(m.beyging)
         # Check the case and number only
         # (don't check the gender, even if present, since it isn't found in BÍN)
-        return terminal.fbits_match_mask(
-            BIN_Token.VBIT_CASES | BIN_Token.VBIT_NUMBER, fbits
-        )
+        return terminal.fbits_match_mask(BIN_Token.VBIT_CASES_NUMBER, fbits)
 
     @staticmethod
     def matcher_stt(token: "BIN_Token", terminal: "BIN_Terminal", m: BIN_Tuple) -> bool:
@@ -276,25 +276,24 @@ class WordMatchers:
             # It is necessary to ensure that other word categories do not match,
             # and to find the correct m that actually matches.
             return False
-        if token._is_eo is None:
+        is_eo = token._is_eo
+        if is_eo is None:
             txt = token.t1_lower
             # This token can match an adverb:
-            # Cache whether it can also match a preposition
-            if txt in BIN_Token._NOT_EO:
-                # Explicitly forbidden, no need to check further
-                token._is_eo = False
-            elif txt in BIN_Token._NOT_NOT_EO:
-                # Explicitly allowed, no need to check further
-                token._is_eo = True
-            else:
+            # Cache whether it can also match a preposition.
+            # Explicitly forbidden (_NOT_EO) or allowed (_NOT_NOT_EO)
+            # words need no further checking.
+            is_eo = BIN_Token._EO_OVERRIDE.get(txt)
+            if is_eo is None:
                 # Check whether also a preposition or pronoun
                 # and return False in that case
-                token._is_eo = not (
+                is_eo = not (
                     txt in Prepositions.PP
                     or any(mm.ordfl == "fn" for mm in token.meanings)
                 )
+            token._is_eo = is_eo
         # Return True if this token cannot also match a preposition
-        return token._is_eo
+        return is_eo
 
     @staticmethod
     def matcher_ao(token: "BIN_Token", terminal: "BIN_Terminal", m: BIN_Tuple) -> bool:
@@ -304,10 +303,11 @@ class WordMatchers:
         if terminal.has_any_vbits(BIN_Token.VBIT_ENDING):
             # The terminal has a word or lemma ending constraint,
             # such as _zlega: we don't match unless the meaning is compatible
-            for v in terminal.variants:
-                if v[0] == "z" and not m.ordmynd.endswith(v[1:]):
+            for ending in terminal.word_endings:
+                if not m.ordmynd.endswith(ending):
                     return False
-                elif v[0] == "x" and not m.stofn.endswith(v[1:]):
+            for ending in terminal.lemma_endings:
+                if not m.stofn.endswith(ending):
                     return False
         fbits = BIN_Token.get_fbits(m.beyging)
         # The fbits may contain MST and EST
@@ -331,17 +331,19 @@ class WordMatchers:
         # meanings of the token (the list in token.t2) do not include
         # the fs category. This effectively makes the prepositions
         # exempt from the ambiguous_phrases optimization.
-        if fs not in Prepositions.PP:
+        # Note: PP is a defaultdict, so we use get() to avoid inserting fs
+        pp_cases = Prepositions.PP.get(fs)
+        if pp_cases is None:
             # Not a preposition
             return False
         var0 = terminal.variant(0)
         if var0 == "nh":
             # Only prepositions marked as nh can match
             return fs in Prepositions.PP_NH
-        if var0 not in Prepositions.PP[fs]:
+        if var0 not in pp_cases:
             # This preposition cannot govern the required case
             return False
-        if fs in Prepositions.PP_COMMON and m.ordfl != "fs":
+        if m.ordfl != "fs" and fs in Prepositions.PP_COMMON:
             # For a certain set of common, 'plain' prepositions,
             # that are tagged as such in BÍN, we do in fact
             # require the meaning to match
@@ -371,14 +373,9 @@ class WordMatchers:
             # Never match neutral terminals
             return False
         # Check case, if present
-        if m.beyging != "-":
-            if any(
-                (BIN_Token.VARIANT[c] or "*") in m.beyging
-                and not terminal.has_variant(c)
-                for c in BIN_Token.CASES
-            ):
-                # The name has an associated case, but this is not it: quit
-                return False
+        if BIN_Token.get_fbits(m.beyging) & BIN_Token.VBIT_CASES & ~terminal.case_vbits:
+            # The name has an associated case, but this is not it: quit
+            return False
         if terminal.has_vbits(BIN_Token.VBIT_KK) and m.ordfl != "kk":
             # Masculine specified but the name is feminine: no match
             return False
@@ -399,17 +396,18 @@ class WordMatchers:
             # Not a street name or place name
             # (götuheiti, örnefni, bæir, þorp)
             return False
-        if BIN_Token.KIND.get(m.ordfl, m.ordfl) != "no":
+        if m.ordfl not in BIN_Token.NOUNS_SET:
             return False
-        for v in terminal.variants:
-            if v in BIN_Token.GENDERS_SET:
-                if m.ordfl != v:
-                    # Mismatched gender
-                    return False
-            elif (BIN_Token.VARIANT[v] or "*") not in m.beyging:
-                # Required case or number not found: no match
-                return False
-        return True
+        gender = terminal.gender_vbits
+        if gender and gender != BIN_Token.VBIT[m.ordfl]:
+            # Mismatched gender
+            return False
+        # Check that the required case and number are present in the meaning.
+        # As in matcher_no(), the FBIT_MASK variants are not part of the
+        # terminal's fbits and are thus not checked against the beyging.
+        return terminal.fbits_match_mask(
+            BIN_Token.VBIT_NOT_GENDERS, BIN_Token.get_fbits(m.beyging)
+        )
 
     @staticmethod
     def matcher_sérnafn(
@@ -435,10 +433,7 @@ class WordMatchers:
         # The terminal is sérnafn_case: We only accept nouns or adjectives
         # that match the given case
         fbits = BIN_Token.get_fbits(m.beyging) & BIN_Token.VBIT_CASES
-        return BIN_Token.KIND.get(m.ordfl, m.ordfl) in {
-            "no",
-            "lo",
-        } and terminal.fbits_match(fbits)
+        return m.ordfl in BIN_Token.NOUNS_ADJ_SET and terminal.fbits_match(fbits)
 
     @staticmethod
     def matcher_default(
@@ -459,18 +454,15 @@ class WordMatchers:
                 # abbreviation such as 'hr.' that is matching the literal
                 # terminal 'herra:kk'_et/fall): only look at the gender,
                 # and permit singular forms only
-                fbits = BIN_Token.VBIT[m.ordfl] | BIN_Token.VBIT["et"]
-                return terminal.fbits_match_mask(
-                    BIN_Token.VBIT_GENDERS | BIN_Token.VBIT_NUMBER, fbits
-                )
+                fbits = BIN_Token.VBIT[m.ordfl] | BIN_Token.VBIT_ET
+                return terminal.fbits_match_mask(BIN_Token.VBIT_GENDERS_NUMBER, fbits)
             fbits = 0
         else:
             # If the meaning is a noun, its gender is coded in the ordfl attribute
-            # In that case, add it to the beyging field so that the relevant fbits
-            # are included and can be matched against the terminal if it requires
-            # a gender
-            fbits = BIN_Token.get_fbits(
-                m.beyging + BIN_Token.GENDERS_MAP.get(m.ordfl, "")
+            # In that case, add its bit to the fbits of the beyging field so that
+            # it can be matched against the terminal if it requires a gender
+            fbits = BIN_Token.get_fbits(m.beyging) | BIN_Token.GENDERS_FBIT.get(
+                m.ordfl, 0
             )
         # Check whether variants required by the terminal are present
         # in the meaning string
@@ -498,7 +490,7 @@ class WordMatchers:
         # matching 'hafast', which is usually not what you want for an auxiliary verb.
         if terminal.colon_cat != "so" or terminal.is_mm:
             return True
-        return "MM" not in m.beyging
+        return not (BIN_Token.get_fbits(m.beyging) & BIN_Token.VBIT_MM)
 
     @staticmethod
     def matcher_uppercase_lemma_literal(
@@ -509,6 +501,35 @@ class WordMatchers:
         return WordMatchers.matcher_default(token, terminal, m)
 
 
+# Dispatch table mapping the first part of a terminal name, i.e. its
+# word category, to the corresponding matching function in WordMatchers.
+# Categories that are not found here use WordMatchers.matcher_default().
+_MATCHERS: Mapping[str, MatcherFunc] = {
+    "so": WordMatchers.matcher_so,
+    "no": WordMatchers.matcher_no,
+    "lo": WordMatchers.matcher_lo,
+    "abfn": WordMatchers.matcher_abfn,
+    "pfn": WordMatchers.matcher_pfn,
+    "stt": WordMatchers.matcher_stt,
+    "eo": WordMatchers.matcher_eo,
+    "ao": WordMatchers.matcher_ao,
+    "fs": WordMatchers.matcher_fs,
+    "töl": WordMatchers.matcher_töl,
+    "person": WordMatchers.matcher_person,
+    "gata": WordMatchers.matcher_gata,
+    "sérnafn": WordMatchers.matcher_sérnafn,
+}
+
+
+class _FbitsCache(Dict[str, int]):
+    """A cache of fbits keyed by BIN 'beyging' strings,
+    calculating each missing entry on first access"""
+
+    def __missing__(self, beyging: str) -> int:
+        fbits = self[beyging] = BIN_Token.fbits(beyging)
+        return fbits
+
+
 class BIN_Token(Token):
     """
     Wrapper class for a token to be processed by the parser
@@ -607,6 +628,8 @@ class BIN_Token(Token):
     FBIT: Mapping[str, int] = {
         val: 1 << i for i, val in enumerate(VARIANT.values()) if val
     }
+    # The FBIT items as a tuple, for fast iteration in fbits()
+    _FBIT_ITEMS = tuple(FBIT.items())
 
     VBIT_ET = VBIT["et"]
     VBIT_FT = VBIT["ft"]
@@ -622,6 +645,7 @@ class BIN_Token(Token):
     VBIT_BH = VBIT["bh"]
     VBIT_LH = VBIT["lhþt"]
     VBIT_MM = VBIT["mm"]
+    VBIT_VB = VBIT["vb"]
     VBIT_GM = VBIT["gm"]
     VBIT_GR = VBIT["gr"]
     VBIT_OP = VBIT["op"]
@@ -645,11 +669,23 @@ class BIN_Token(Token):
 
     GENDERS = ("kk", "kvk", "hk")
     GENDERS_SET = NOUNS_SET = frozenset(GENDERS)
+    # Word categories (ordfl) of nouns and adjectives
+    NOUNS_ADJ_SET = NOUNS_SET | {"lo"}
     GENDERS_MAP = {"kk": "KK", "kvk": "KVK", "hk": "HK"}
+    # The fbits corresponding to the GENDERS_MAP strings
+    GENDERS_FBIT: Mapping[str, int] = {"kk": VBIT_KK, "kvk": VBIT_KVK, "hk": VBIT_HK}
 
     VBIT_CASES = VBIT["nf"] | VBIT["þf"] | VBIT["þgf"] | VBIT["ef"]
     VBIT_GENDERS = VBIT["kk"] | VBIT["kvk"] | VBIT["hk"]
     VBIT_NUMBER = VBIT["et"] | VBIT["ft"]
+    # Precomputed combinations of the above, for the matchers
+    VBIT_NOT_GENDERS = ~VBIT_GENDERS
+    VBIT_CASES_NUMBER = VBIT_CASES | VBIT_NUMBER
+    VBIT_GENDERS_NUMBER = VBIT_GENDERS | VBIT_NUMBER
+    VBIT_KK_KVK = VBIT_KK | VBIT_KVK
+    VBIT_FT_KK_KVK = VBIT_FT | VBIT_KK | VBIT_KVK
+    VBIT_ET_HK = VBIT_ET | VBIT_HK
+    VBIT_ABBREV_GR = VBIT_ABBREV | VBIT_GR
 
     # Variants to be checked for verbs
     VERB_VARIANTS = (
@@ -747,6 +783,15 @@ class BIN_Token(Token):
         ]
     )
 
+    # Combined lookup of the explicit eo verdicts above, so that matcher_eo
+    # needs a single dict probe instead of two set membership tests.
+    # _NOT_EO comes last, so that it takes priority, as it did when
+    # the sets were tested one after the other.
+    _EO_OVERRIDE: Mapping[str, bool] = {
+        **dict.fromkeys(_NOT_NOT_EO, True),
+        **dict.fromkeys(_NOT_EO, False),
+    }
+
     # Words that are not eligible for interpretation as proper names,
     # even if they are capitalized
     _NOT_PROPER_NAME = frozenset(
@@ -800,28 +845,78 @@ class BIN_Token(Token):
     # as it would be incorrect to say "365 skulduðu 389 milljónir".
     _SINGULAR_SPECIAL_CASES = frozenset([365])
 
+    # Lookup table for singular numbers: all integers whose modulo 100
+    # ends in 1 are singular, except 11
+    _SINGULAR_MOD100 = tuple(i != 11 and i % 10 == 1 for i in range(100))
+    # Fraction characters that can end a number, and the subset of those
+    # that have a numerator of 1 and are therefore singular
+    _FRACTIONS = frozenset("¼½¾⅐⅑⅒⅓⅔⅕⅖⅗⅘⅙⅚⅛⅜⅝⅞")
+    _SINGULAR_FRACTIONS = frozenset("¼½⅐⅑⅒⅓⅕⅙⅛")
+
     # The following is a filter on the punctuation tokens that are passed into
     # the parser (after being wrapped into BIN_Token objects). The actual
     # test is made on the normalized punctuation, i.e. on the t.val[1] field
     # of each punctuation token.
     _UNDERSTOOD_PUNCTUATION = ".?!,:;-()[]"
 
-    _MEANING_CACHE: Dict[str, int] = {}
-    _VARIANT_CACHE: Dict[str, Set[str]] = {}
+    # Index of the cases list within the t2 tuple of number-like tokens.
+    # The genders list immediately follows it.
+    _CASES_INDEX: Mapping[int, int] = {
+        TOK.NUMBER: 1,
+        TOK.CURRENCY: 1,
+        TOK.PERCENT: 1,
+        TOK.AMOUNT: 2,
+    }
+
+    _MEANING_CACHE: Dict[str, int] = _FbitsCache()
+    _VARIANT_CACHE: Dict[str, FrozenSet[str]] = {}
+    # Cache of fbits for the hyphen-separated parts of 'beyging' strings.
+    # No FBIT key contains a hyphen, so the fbits of a 'beyging' string
+    # are the union of the fbits of its parts.
+    _CHUNK_FBITS: Dict[str, int] = {}
+    # Likewise, a cache of the variants for each part of a 'beyging' string
+    _CHUNK_VARIANTS: Dict[str, FrozenSet[str]] = {}
+
+    # There is one BIN_Token per token in each parsed sentence, and the
+    # matchers read their attributes constantly
+    __slots__ = (
+        "t0",
+        "t1",
+        "t1_lower",
+        "is_compound",
+        "t2",
+        "is_upper",
+        "_key",
+        "_hash",
+        "_index",
+        "_error",
+        "_is_eo",
+        "_matching_func",
+        "_case_vbits",
+        "_gender_vbits",
+    )
 
     def __init__(self, t: Tok, original_index: int) -> None:
         # Here, we convert a token coming from the Tokenizer (TOK class)
         # to a token object that will be seen by the parser and used to
         # check matches against grammar terminals.
 
-        # We use the normalized form of punctuation when parsing
-        txt: str = t.punctuation if t.kind == TOK.PUNCTUATION else t.txt
+        kind = t.kind
+        txt: str
+        lower: str
+        if kind == TOK.PUNCTUATION:
+            # We use the normalized form of punctuation when parsing.
+            # Punctuation has no case, so there is no need to lowercase it.
+            txt = lower = t.punctuation
+        else:
+            txt = t.txt
+            lower = txt.lower()
 
-        super().__init__(TOK.descr[t.kind], txt)
+        super().__init__(TOK.descr[kind], txt)
 
-        self.t0: int = t.kind  # Token type (TOK.WORD, etc.)
+        self.t0: int = kind  # Token type (TOK.WORD, etc.)
         self.t1: str = txt  # Token text
-        self.t1_lower: str = txt.lower()  # Token text, lower case
+        self.t1_lower: str = lower  # Token text, lower case
         self.is_compound: bool = False
         # t2 contains auxiliary token information,
         # such as part-of-speech annotation, numbers, etc.
@@ -830,14 +925,16 @@ class BIN_Token(Token):
             # Ensure that the t2 field is hashable by converting lists to tuples
             # (Such tokens can be TOK.WORD or TOK.PERSON)
             self.t2 = tuple(cast(BIN_TupleList, t.val))
-            if self.t0 == TOK.WORD:
+            if kind == TOK.WORD:
                 # Note whether the word is constructed by compounding
                 self.is_compound = any("-" in m.stofn for m in t.meanings)
         else:
             self.t2 = t.val
         # True if starts with upper case
-        self.is_upper = self.t1[0] != self.t1_lower[0]
-        self._hash: Optional[int] = None  # Cached hash
+        self.is_upper = txt[0] != lower[0]
+        self._key: Optional[Tuple[Hashable, ...]] = None  # Cached key
+        # Cached hash; -1 means not yet calculated, since hash() never returns -1
+        self._hash = -1
         self._index = original_index  # Index of original token within sentence
 
         # Copy error information from the original token, if any
@@ -852,6 +949,19 @@ class BIN_Token(Token):
         # Cache the matching function to use with this token
         self._matching_func = BIN_Token._MATCHING_FUNC[self.t0]
 
+        # For number-like tokens (numbers, amounts, currencies, percentages),
+        # store the variant bits of the cases and genders associated with them
+        self._case_vbits = 0
+        self._gender_vbits = 0
+        ix = BIN_Token._CASES_INDEX.get(kind)
+        if ix is not None:
+            val = cast(Tuple[Any, ...], self.t2)
+            vbit = BIN_Token.VBIT
+            for c in val[ix] or ():
+                self._case_vbits |= vbit.get(c, 0)
+            for g in val[ix + 1] or ():
+                self._gender_vbits |= vbit.get(g, 0)
+
     @property
     def is_word(self) -> bool:
         return self.t0 == TOK.WORD
@@ -898,35 +1008,53 @@ class BIN_Token(Token):
         if self.t2 is None:
             return '"{0}" {1}'.format(self.t1, self._kind)
         return '"{0}" {1} {2}'.format(
-            self.t1, self._kind, json.dumps(self.t2, ensure_ascii=False)
+            self.t1, self._kind, _JSON_ENCODER.encode(self.t2)
         )
 
     @classmethod
     def fbits(cls, beyging: str) -> int:
         """Convert a 'beyging' field from BIN to a set of fbits"""
-        bit = cls.FBIT
-        or_func: Callable[[int, int], int] = lambda x, y: x | y
-        return reduce(or_func, (b for key, b in bit.items() if key in beyging), 0)
+        # The parts (GM, FH, NT, 3P, ET...) recur across many 'beyging'
+        # strings, so only previously unseen parts need to be scanned
+        fbits = 0
+        chunk_fbits = cls._CHUNK_FBITS
+        for chunk in beyging.split("-"):
+            bits = chunk_fbits.get(chunk)
+            if bits is None:
+                bits = 0
+                for key, b in cls._FBIT_ITEMS:
+                    if key in chunk:
+                        bits |= b
+                chunk_fbits[chunk] = bits
+            fbits |= bits
+        return fbits
 
     @classmethod
     def get_fbits(cls, beyging: str) -> int:
         """Get the (cached) fbits for a BIN 'beyging' field"""
-        fbits = cls._MEANING_CACHE.get(beyging)
-        if fbits is None:
-            # Calculate a set of bits that represent the variants
-            # present in m.beyging
-            fbits = cls.fbits(beyging)
-            cls._MEANING_CACHE[beyging] = fbits
-        return fbits
+        # The cache calculates the set of bits that represent the variants
+        # present in the beyging string if it hasn't seen it before
+        return cls._MEANING_CACHE[beyging]
 
     @classmethod
-    def bin_variants(cls, beyging: str) -> Set[str]:
-        """Return the set of variants coded in the given BÍN beyging string"""
+    def bin_variants(cls, beyging: str) -> FrozenSet[str]:
+        """Return the set of variants coded in the given BÍN beyging string.
+        The set is shared via a cache and is therefore immutable."""
         if not beyging:
-            return set()
-        vset = cls._VARIANT_CACHE.get(beyging)
-        if vset is None:
-            vset = set(k for k, v in cls.VARIANT_EX.items() if v in beyging)
+            return frozenset()
+        cached = cls._VARIANT_CACHE.get(beyging)
+        if cached is None:
+            # No VARIANT_EX value contains a hyphen, so the variants
+            # can be collected part by part, caching those of each part
+            vset: Set[str] = set()
+            chunk_variants = cls._CHUNK_VARIANTS
+            for chunk in beyging.split("-"):
+                variants = chunk_variants.get(chunk)
+                if variants is None:
+                    variants = chunk_variants[chunk] = frozenset(
+                        k for k, v in cls.VARIANT_EX.items() if v in chunk
+                    )
+                vset |= variants
             if "lhþt" in vset:
                 # Special case, since 'þt' is a substring of 'lhþt'
                 vset.remove("þt")
@@ -939,8 +1067,8 @@ class BIN_Token(Token):
                 # For impersonal verbs, all three persons are identical
                 # and not required
                 vset -= {"p1", "p2", "p3"}
-            cls._VARIANT_CACHE[beyging] = vset
-        return vset
+            cached = cls._VARIANT_CACHE[beyging] = frozenset(vset)
+        return cached
 
     @staticmethod
     def mm_verb_stem(verb: str) -> str:
@@ -959,7 +1087,7 @@ class BIN_Token(Token):
         i.e. never appears with a nominative subject"""
         # This is overridden in reynir_correct.errfinder
         # Note that we don't need to check the form for "OP" here,
-        # since that check is done in the _RESTRICTIVE_VARIANTS loop.
+        # since that check is done via _RESTRICTIVE_MASK in verb_matches().
         return VerbSubjects.is_strictly_impersonal(verb)
 
     @classmethod
@@ -973,11 +1101,16 @@ class BIN_Token(Token):
     def verb_subject_matches(cls, verb: str, subj: str) -> bool:
         """Returns True if the given subject type/case is allowed for this verb"""
         # This is overridden in reynir_correct.errfinder
-        return subj in cls._VERB_SUBJECTS.get(verb, set())
+        return subj in cls._VERB_SUBJECTS.get(verb, ())
 
     # Variants that must be present in the terminal
     # if they are present in the verb form
     _RESTRICTIVE_VARIANTS: Tuple[str, ...] = ("sagnb", "lhþt", "bh", "op", "sp", "expl")
+    # Bit mask of the restrictive variants, initialized later
+    _RESTRICTIVE_MASK: int = 0
+    # Bit mask of the verb variants that must be present in the verb form
+    # if they are present in the terminal, initialized later
+    VBIT_VERB_FORMS: int = 0
 
     @classmethod
     @lru_cache(maxsize=2048)
@@ -985,39 +1118,42 @@ class BIN_Token(Token):
         """Return True if the verb lemma with the given BÍN inflection string
         matches the verb terminal (so_xxx_...)"""
 
+        # Test the variants present in the form via its (cached) fbits
+        # rather than with repeated substring searches
+        fbits = cls.get_fbits(form)
         if terminal.is_subj:
             # Verb subject in non-nominative case
             # Examples:
             # 'Mig langar að fara til Frakklands'
             # 'Páli þykir þetta vera tóm vitleysa'
             if terminal.is_nh:
-                if "NH" not in form:
+                if not fbits & cls.VBIT_NH:
                     # Infinitive (nafnháttur)
                     return False
             if terminal.is_mm:
                 # Middle voice ('miðmynd')
                 # For subj_mm, we don't care about anything but MM
-                return "MM" in form
+                return bool(fbits & cls.VBIT_MM)
             if terminal.is_gm:
                 # Active voice ('germynd')
-                if "GM" not in form:
+                if not fbits & cls.VBIT_GM:
                     return False
-            if terminal.is_singular and "ET" not in form:
+            if terminal.is_singular and not fbits & cls.VBIT_ET:
                 # Require singular
                 return False
-            if terminal.is_plural and "FT" not in form:
+            if terminal.is_plural and not fbits & cls.VBIT_FT:
                 # Require plural
                 return False
             # Don't allow the expletive form ('það') for _subj terminals
-            if "það" in form:
+            if fbits & cls.VBIT_EXPL:
                 return False
-            form_lh = "LHÞT" in form
+            form_lh = bool(fbits & cls.VBIT_LH)
             if terminal.is_lh:
                 return form_lh and cls.verb_subject_matches(verb, "lhþt")
             # Don't allow the past participle unless explicitly requested in terminal
             if form_lh:
                 return False
-            form_sagnb = "SAGNB" in form
+            form_sagnb = bool(fbits & cls.VBIT_SAGNB)
             if terminal.has_variant("none"):
                 # subj_none: Check that the verb is listed in the 'none'
                 # subject list in Verbs.conf
@@ -1057,30 +1193,25 @@ class BIN_Token(Token):
         if cls.verb_is_strictly_impersonal(verb, form):
             return False
         if terminal.is_expl:
-            if "það" not in form:
+            if not fbits & cls.VBIT_EXPL:
                 return False
-        if terminal.is_singular and "FT" in form:
+        if terminal.is_singular and fbits & cls.VBIT_FT:
             # Can't use plural verb if singular terminal
             return False
-        if terminal.is_plural and "ET" in form:
+        if terminal.is_plural and fbits & cls.VBIT_ET:
             # Can't use singular verb if plural terminal
             return False
-        # Check that person (1st, 2nd, 3rd) and other variant requirements match
-        for v in terminal.variants:
-            # Lookup variant to see if it is one of the required ones for verbs
-            rq = cls._VERB_FORMS.get(v)
-            if rq and rq not in form:
-                # If this is required variant that is not found in the form we have,
-                # return False
-                return False
+        # Check that person (1st, 2nd, 3rd) and other variant requirements match,
+        # i.e. that all verb variants of the terminal are also in the form we have
+        if terminal.verb_form_vbits & ~fbits:
+            return False
         # Check restrictive variants, i.e. we don't accept meanings
         # that have those unless they are explicitly present in the terminal
         # Be careful with "lh" here
-        for v in cls._RESTRICTIVE_VARIANTS:
-            if (cls.VARIANT.get(v) or "*") in form and not terminal.has_variant(v):
-                return False
+        if not terminal.has_vbits(fbits & cls._RESTRICTIVE_MASK):
+            return False
         if terminal.is_lh:
-            if "VB" in form and not terminal.has_variant("vb"):
+            if fbits & cls.VBIT_VB and not terminal.has_variant("vb"):
                 # We want only the strong declensions ("SB") of lhþt,
                 # not the weak ones, unless explicitly requested
                 return False
@@ -1106,8 +1237,7 @@ class BIN_Token(Token):
                     return False
             return True
         # Is this a middle voice inflection form?
-        is_mm = "MM" in form
-        if is_mm:
+        if fbits & cls.VBIT_MM:
             # For MM forms, do not use the normal infinitive of the verb
             # to look up the verb frame; instead, use the MM-NH infinitive.
             # This means that for instance "eignaðist hest" is not resolved
@@ -1146,26 +1276,39 @@ class BIN_Token(Token):
                 # this if you know what you're doing.
                 return False
             case = terminal.variant(0)
-            return any(pn.case == case for pn in self.person_names)
+            for pn in self.person_names:
+                if pn.case == case:
+                    return True
+            return False
         if not terminal.startswith("person"):
             if terminal.matcher is WordMatchers.matcher_uppercase_lemma_literal:
                 # We allow lemma terminals ('Vagn'_þgf_kk) to match
                 # person names
-                if all(pn.name != terminal.first for pn in self.person_names):
+                name = terminal.first
+                for pn in self.person_names:
+                    if pn.name == name:
+                        break
+                else:
                     # No name match
                     return False
             else:
                 return False
-        if not terminal.num_variants:
+        num_variants = terminal.num_variants
+        if not num_variants:
             # No variant specified on terminal: we're done
             return True
         # Check each PersonName tuple in the t2 list
         case = terminal.variant(0)
-        gender = terminal.variant(1) if terminal.num_variants > 1 else None
-        return any(
-            case == pn.case and (gender is None or gender == pn.gender)
-            for pn in self.person_names
-        )
+        if num_variants > 1:
+            gender = terminal.variant(1)
+            for pn in self.person_names:
+                if case == pn.case and gender == pn.gender:
+                    return True
+        else:
+            for pn in self.person_names:
+                if case == pn.case:
+                    return True
+        return False
 
     def matches_ENTITY(self, terminal: "BIN_Terminal") -> bool:
         """Handle an entity name token, matching it with an entity terminal"""
@@ -1189,37 +1332,37 @@ class BIN_Token(Token):
     def matches_CURRENCY(self, terminal: "BIN_Terminal") -> bool:
         """A currency name token matches a noun (no) terminal,
         or a currency/iso/fall terminal"""
+        tfirst = terminal.first
         iso, cases, genders = cast(CurrencyTuple, self.t2)
-        if terminal.startswith("currency"):
-            if terminal.num_variants < 1 or terminal.variant(0).upper() != iso:
+        if tfirst == "currency":
+            num_variants = terminal.num_variants
+            if num_variants < 1 or terminal.variant(0).upper() != iso:
                 # ISO currency code does not match
                 return False
-            if terminal.num_variants >= 2:
+            if num_variants >= 2:
                 # Check case
                 if not cases or terminal.variant(1) not in cases:
                     # The case is not present in the token
                     return False
             # The token matches
             return True
-        if not terminal.startswith("no"):
+        if tfirst != "no":
             return False
         if terminal.is_abbrev:
             # A currency does not match an abbreviation
             return False
         if cases:
             # See whether any of the allowed cases match the terminal
-            for c in BIN_Token.CASES:
-                if terminal.has_variant(c) and c not in cases:
-                    return False
+            if terminal.case_vbits & ~self._case_vbits:
+                return False
         if genders:
             # See whether any of the allowed genders match the terminal
-            for g in BIN_Token.GENDERS:
-                if terminal.has_variant(g) and g not in genders:
-                    return False
+            if terminal.gender_vbits & ~self._gender_vbits:
+                return False
         else:
             # Match only the neutral gender if no gender given
             # return not (terminal.has_variant("kk") or terminal.has_variant("kvk"))
-            return not terminal.has_any_vbits(BIN_Token.VBIT_KK | BIN_Token.VBIT_KVK)
+            return not terminal.has_any_vbits(BIN_Token.VBIT_KK_KVK)
         return True
 
     def is_correct_singular_or_plural(self, terminal: "BIN_Terminal") -> bool:
@@ -1228,17 +1371,20 @@ class BIN_Token(Token):
         singular, except 11."""
         singular = False
         num = cast(NumberTuple, self.t2)
-        orig_i = i = int(num[0])
-        if float(i) == float(num[0]):
+        orig_i = int(num[0])
+        if float(orig_i) == float(num[0]):
             # Whole number (integer): may be singular
-            i = abs(i) % 100
-            singular = (i != 11) and (i % 10) == 1
-        elif self.t1[-1] in "¼½¾⅐⅑⅒⅓⅔⅕⅖⅗⅘⅙⅚⅛⅜⅝⅞":
-            # For numbers ending with fractions, we allow
-            # singular if the integer part is singular or
-            # if the fractional part has a numerator of 1
-            i = abs(i) % 100
-            singular = ((i != 11) and (i % 10) == 1) or self.t1[-1] in "¼½⅐⅑⅒⅓⅕⅙⅛"
+            singular = BIN_Token._SINGULAR_MOD100[abs(orig_i) % 100]
+        else:
+            last = self.t1[-1]
+            if last in BIN_Token._FRACTIONS:
+                # For numbers ending with fractions, we allow
+                # singular if the integer part is singular or
+                # if the fractional part has a numerator of 1
+                singular = (
+                    BIN_Token._SINGULAR_MOD100[abs(orig_i) % 100]
+                    or last in BIN_Token._SINGULAR_FRACTIONS
+                )
         if terminal.is_singular and not singular:
             # Terminal is singular but number is plural
             return orig_i in BIN_Token._SINGULAR_SPECIAL_CASES
@@ -1261,7 +1407,10 @@ class BIN_Token(Token):
         if tfirst == "ártal":
             # Allow a 3 or 4 digit integer number to match an 'ártal' terminal
             # if it is within the range 874..2199
-            if not re.match(r"[0-9]{3,4}$", self.t1):
+            # (This is equivalent to re.match(r"[0-9]{3,4}$", self.t1),
+            # but avoids the regex machinery)
+            t1 = self.t1
+            if not (3 <= len(t1) <= 4 and t1.isascii() and t1.isdigit()):
                 return False
             n = int(num)
             return 874 <= n <= 2199
@@ -1283,16 +1432,14 @@ class BIN_Token(Token):
             if not cases or not genders:
                 return False
             # Only check gender for "to", not "töl"
-            for g in BIN_Token.GENDERS:
-                if terminal.has_variant(g) and g not in genders:
-                    return False
+            if terminal.gender_vbits & ~self._gender_vbits:
+                return False
 
         if cases:
             # See whether any of the allowed cases for the token
             # match the terminal
-            for c in BIN_Token.CASES:
-                if terminal.has_variant(c) and c not in cases:
-                    return False
+            if terminal.case_vbits & ~self._case_vbits:
+                return False
 
         return True
 
@@ -1301,21 +1448,23 @@ class BIN_Token(Token):
 
     def matches_AMOUNT(self, terminal: "BIN_Terminal") -> bool:
         """An amount token matches an amount terminal and a noun terminal"""
+        tfirst = terminal.first
         _, iso, cases, genders = cast(AmountTuple, self.t2)
-        if terminal.startswith("amount"):
-            if terminal.num_variants >= 1 and terminal.variant(0).upper() != iso:
+        if tfirst == "amount":
+            num_variants = terminal.num_variants
+            if num_variants >= 1 and terminal.variant(0).upper() != iso:
                 # An ISO currency code is specified and it does not match the token
                 return False
-            if terminal.num_variants >= 2:
+            if num_variants >= 2:
                 # A case is specified as well
                 if not cases or terminal.variant(1) not in cases:
                     # The case is not present in the token
                     return False
             # The token matches
             return True
-        if not terminal.startswith("no"):
+        if tfirst != "no":
             return False
-        if terminal.has_any_vbits(BIN_Token.VBIT_ABBREV | BIN_Token.VBIT_GR):
+        if terminal.has_any_vbits(BIN_Token.VBIT_ABBREV_GR):
             # An amount does not match an abbreviation or
             # a definite article
             return False
@@ -1323,26 +1472,25 @@ class BIN_Token(Token):
             return False
         if cases:
             # See whether any of the allowed cases match the terminal
-            for c in BIN_Token.CASES:
-                if terminal.has_variant(c) and c not in cases:
-                    return False
+            if terminal.case_vbits & ~self._case_vbits:
+                return False
         if genders is None:
             # No gender: match neutral gender only
-            if terminal.has_any_vbits(BIN_Token.VBIT_KK | BIN_Token.VBIT_KVK):
+            if terminal.has_any_vbits(BIN_Token.VBIT_KK_KVK):
                 return False
         else:
             # Associated gender
-            for g in BIN_Token.GENDERS:
-                if terminal.has_variant(g) and g not in genders:
-                    return False
+            if terminal.gender_vbits & ~self._gender_vbits:
+                return False
         return True
 
     def matches_PERCENT(self, terminal: "BIN_Terminal") -> bool:
         """A percent token matches a number (töl) or noun terminal"""
-        if terminal.startswith("töl") or terminal.startswith("prósenta"):
+        tfirst = terminal.first
+        if tfirst == "töl" or tfirst == "prósenta":
             return True
         # Matches number and noun terminals only
-        if not terminal.startswith("no"):
+        if tfirst != "no":
             return False
         if terminal.is_abbrev:
             return False
@@ -1354,9 +1502,8 @@ class BIN_Token(Token):
         _, cases, _ = cast(NumberTuple, self.t2)
         if cases:
             # See whether any of the allowed cases match the terminal
-            for c in BIN_Token.CASES:
-                if terminal.has_variant(c) and c not in cases:
-                    return False
+            if terminal.case_vbits & ~self._case_vbits:
+                return False
         # We do not check singular or plural here since phrases such as
         # '35% skattur' and '1% allra blóma' are valid
         return True
@@ -1367,9 +1514,7 @@ class BIN_Token(Token):
             return False
         # Only singular match ('2014 var gott ár', not '2014 voru góð ár')
         # Years only match the neutral gender
-        if terminal.has_any_vbits(
-            BIN_Token.VBIT_FT | BIN_Token.VBIT_KK | BIN_Token.VBIT_KVK
-        ):
+        if terminal.has_any_vbits(BIN_Token.VBIT_FT_KK_KVK):
             return False
         # No case associated with year numbers: match all
         return True
@@ -1477,7 +1622,7 @@ class BIN_Token(Token):
         # neutral noun in all cases, but without the definite article ('greinir')
         return (
             terminal.startswith("no")
-            and terminal.has_vbits(BIN_Token.VBIT_ET | BIN_Token.VBIT_HK)
+            and terminal.has_vbits(BIN_Token.VBIT_ET_HK)
             and not terminal.has_vbits(BIN_Token.VBIT_GR)
         )
 
@@ -1561,29 +1706,68 @@ class BIN_Token(Token):
         equivalent for parsing purposes. This hash is inter alia used by the
         alloc_cache() function in fastparser.py to optimize token/terminal
         matching calls."""
-        if self.t0 == TOK.WORD:
-            # For words, the t2 tuple is significant because it may have been
-            # cut down by the tokenizer due to the word's context, cf. the
-            # [ambiguous_phrases] section in Main.conf
-            return self.t0, self.t1, self.t2
-        # Otherwise, the t0 and t1 fields are enough
-        return self.t0, self.t1
+        key = self._key
+        if key is None:
+            if self.t0 == TOK.WORD:
+                # For words, the t2 tuple is significant because it may have
+                # been cut down by the tokenizer due to the word's context,
+                # cf. the [ambiguous_phrases] section in Main.conf
+                key = (self.t0, self.t1, self.t2)
+            else:
+                # Otherwise, the t0 and t1 fields are enough
+                key = (self.t0, self.t1)
+            self._key = key
+        return key
 
     def __hash__(self) -> int:
         """Calculate and cache a hash for this token"""
-        if self._hash is None:
-            self._hash = hash(self.key)
-        return self._hash
+        h = self._hash
+        if h == -1:
+            h = self._hash = hash(self.key)
+        return h
 
     @classmethod
     def init(cls) -> None:
+        # The fbits of 'beyging' strings are calculated part by part
+        assert not any("-" in key for key in cls.FBIT)
+        assert not any("-" in v for v in cls.VARIANT_EX.values())
+        # A word cannot be both forbidden and allowed as an eo
+        assert not (cls._NOT_EO & cls._NOT_NOT_EO)
         # Initialize cached dictionary of verb variant forms in BIN
         cls._VERB_FORMS = {v: cls.VARIANT[v] or "" for v in cls.VERB_VARIANTS}  # type: ignore
+        # Initialize the bit mask of restrictive verb variants
+        cls._RESTRICTIVE_MASK = reduce(
+            lambda x, y: (x | y), (cls.VBIT[v] for v in cls._RESTRICTIVE_VARIANTS), 0
+        )
+        # Initialize the bit mask of verb variants that have BIN forms.
+        # For these, the variant bit equals the fbit of the form.
+        verb_forms = [v for v in cls.VERB_VARIANTS if cls.VARIANT[v]]
+        assert all(cls.VBIT[v] == cls.FBIT[cls.VARIANT[v] or ""] for v in verb_forms)
+        cls.VBIT_VERB_FORMS = reduce(
+            lambda x, y: (x | y), (cls.VBIT[v] for v in verb_forms), 0
+        )
 
 
 BIN_Token.init()
 
 
+# Shared variant sets of terminals, along with their variant bits,
+# keyed by their variant tuples
+_VSET_CACHE: Dict[Tuple[str, ...], Tuple[FrozenSet[str], int]] = {}
+
+# Sets of word categories (BÍN ordfl values) that match the first part
+# of a terminal name, keyed by that first part. This takes into account
+# that the noun genders kk, kvk and hk all match 'no' terminals.
+_FIRST_KINDS_CACHE: Dict[str, FrozenSet[str]] = {}
+
+# Variant bits for use in has_variant(). The 'x' and 'z' bits are left out
+# since they are set for ending variants (_xur, _zar, etc.), not only for
+# variants that are literally named 'x' or 'z'.
+_HAS_VARIANT_VBIT: Mapping[str, int] = {
+    v: bit for v, bit in BIN_Token.VBIT.items() if v not in ("x", "z")
+}
+
+
 class VariantHandler:
     """Mix-in class used in BIN_Terminal and BIN_LiteralTerminal to add
     querying of terminal variants as well as mapping of variants to
@@ -1617,31 +1801,60 @@ class VariantHandler:
             parts = n.split("_")
         self._first: str = parts[0]
         # Look up matching function in WordMatchers
-        self._matcher = cast(
-            MatcherFunc,
-            getattr(
-                WordMatchers, "matcher_" + self._first, WordMatchers.matcher_default
-            ),
-        )
+        self._matcher = _MATCHERS.get(self._first, WordMatchers.matcher_default)
+        # Word categories matched by matches_first()
+        first_kinds = _FIRST_KINDS_CACHE.get(self._first)
+        if first_kinds is None:
+            kind = BIN_Token.KIND
+            first_kinds = frozenset(k for k, v in kind.items() if v == self._first)
+            if self._first not in kind:
+                first_kinds |= {self._first}
+            _FIRST_KINDS_CACHE[self._first] = first_kinds
+        self._first_kinds = first_kinds
         # The variant set for this terminal, i.e.
         # tname_var1_var2_var3 -> { 'var1', 'var2', 'var3' }
         self._vparts: List[str] = parts[1:]
         self._vcount = len(self._vparts)
-        self._vset = set(self._vparts)
-        # Also map variant names to bits in self._vbits
-        bit = BIN_Token.VBIT
-        self._vbits = reduce(
-            lambda x, y: (x | y), (bit.get(v, 0) for v in self._vset), 0
-        )
+        # Many terminals share the same variant combination, so they
+        # share a single immutable set of variants as well, and the
+        # mapping of variant names to bits is only done once per combination
+        vkey = tuple(self._vparts)
+        cached = _VSET_CACHE.get(vkey)
+        if cached is None:
+            vset = frozenset(vkey)
+            bit = BIN_Token.VBIT
+            vbits = 0
+            for v in vset:
+                vbits |= bit.get(v, 0)
+            cached = _VSET_CACHE[vkey] = (vset, vbits)
+        self._vset, self._vbits = cached
         # Handle the ending constraint variants (_xsomething and _zsomething)
-        # specially
-        for v in self._vset:
-            if v[0] == "x":
-                self._vbits |= BIN_Token.VBIT_LEMMA_ENDING
-            elif v[0] == "z":
-                self._vbits |= BIN_Token.VBIT_WORD_ENDING
+        # specially, storing the endings themselves (sans the x/z prefix)
+        # so that the matchers don't need to decode the variants at run-time
+        self._lemma_endings = tuple(v[1:] for v in self._vparts if v[0] == "x")
+        self._word_endings = tuple(v[1:] for v in self._vparts if v[0] == "z")
+        if self._lemma_endings:
+            self._vbits |= BIN_Token.VBIT_LEMMA_ENDING
+        if self._word_endings:
+            self._vbits |= BIN_Token.VBIT_WORD_ENDING
         # fbits are like vbits but leave out variants that have no BIN meaning
         self._fbits = self._vbits & (~BIN_Token.FBIT_MASK)
+        # Nouns have their gender in the ordfl field rather than in the
+        # 'beyging' string, so the matchers check it separately
+        self._gender_vbits = self._vbits & BIN_Token.VBIT_GENDERS
+        self._case_vbits = self._vbits & BIN_Token.VBIT_CASES
+        self._verb_form_vbits = self._vbits & BIN_Token.VBIT_VERB_FORMS
+        # Store the subject case demanded by an adjective terminal
+        # ('samþykkur Páli'), if any.
+        # Note that nominative ('snf'/'nf') is not allowed here.
+        self._subject_case: Optional[str] = None
+        if self._vbits & BIN_Token.VBIT_SCASES:
+            if self._vbits & BIN_Token.VBIT["sþf"]:
+                self._subject_case = "þf"
+            elif self._vbits & BIN_Token.VBIT["sþgf"]:
+                self._subject_case = "þgf"
+            else:
+                self._subject_case = "ef"
         # For speed, store the cases associated with a verb
         # so_0 -> self._cases = ""
         # so_1_þgf -> self._cases = "þgf"
@@ -1651,6 +1864,34 @@ class VariantHandler:
             self._cases = "".join("_" + self._vparts[1 + i] for i in range(ncases))
         else:
             self._cases = ""
+        # Precompute the variant properties that the matchers query all
+        # the time, so that they are plain attribute reads instead of
+        # property calls that test bits in self._vbits
+        vbits = self._vbits
+        # Gender and case strings corresponding to a variant of this
+        # terminal, if any
+        self.gender: Optional[str] = next(
+            (g for g in BIN_Token.GENDERS if vbits & BIN_Token.VBIT[g]), None
+        )
+        self.case: Optional[str] = next(
+            (c for c in BIN_Token.CASES if vbits & BIN_Token.VBIT[c]), None
+        )
+        self.is_singular = (vbits & BIN_Token.VBIT_ET) != 0
+        self.is_plural = (vbits & BIN_Token.VBIT_FT) != 0
+        self.is_abbrev = (vbits & BIN_Token.VBIT_ABBREV) != 0
+        self.is_nh = (vbits & BIN_Token.VBIT_NH) != 0
+        self.is_mm = (vbits & BIN_Token.VBIT_MM) != 0
+        self.is_gm = (vbits & BIN_Token.VBIT_GM) != 0
+        self.is_subj = (vbits & BIN_Token.VBIT_SUBJ) != 0
+        self.is_sagnb = (vbits & BIN_Token.VBIT_SAGNB) != 0
+        self.is_op = (vbits & BIN_Token.VBIT_OP) != 0
+        # Lýsingarháttur þátíðar ("LHÞT")
+        self.is_lh = (vbits & BIN_Token.VBIT_LH) != 0
+        # Lýsingarháttur nútíðar ("LH-NT" or "LHNT")
+        self.is_lh_nt = (vbits & BIN_Token.VBIT_LHNT) == BIN_Token.VBIT_LHNT
+        self.is_vh = (vbits & BIN_Token.VBIT_VH) != 0
+        self.is_bh = (vbits & BIN_Token.VBIT_BH) != 0
+        self.is_expl = (vbits & BIN_Token.VBIT_EXPL) != 0
 
     def startswith(self, part: str) -> bool:
         """Returns True if the terminal name starts with the given string"""
@@ -1664,8 +1905,8 @@ class VariantHandler:
     def matches_first(self, t_kind: str, t_val: str, t_lit: str) -> bool:
         """Returns True if the first part of the terminal name matches the
         given word category"""
-        # Convert 'kk', 'kvk', 'hk' to 'no' before doing the compare
-        return self._first == BIN_Token.KIND.get(t_kind, t_kind)
+        # 'kk', 'kvk' and 'hk' match 'no', cf. BIN_Token.KIND
+        return t_kind in self._first_kinds
 
     def matches_token(self, token: BIN_Token, m: BIN_Tuple) -> bool:
         """Test whether this terminal matches the meaning m of the given token"""
@@ -1674,10 +1915,12 @@ class VariantHandler:
     def matches_token_meaning(self, token: BIN_Token) -> Union[bool, BIN_Tuple]:
         """Return the meaning of the token which matches this terminal,
         if any, or False if none"""
+        # self._matcher is a reference to a matching function within
+        # the WordMatchers class
+        matcher = self._matcher
+        terminal = cast(BIN_Terminal, self)
         for m in token.meanings:
-            # self._matcher is a reference to a matching function within
-            # the WordMatchers class
-            if self._matcher(token, cast(BIN_Terminal, self), m):
+            if matcher(token, terminal, m):
                 # This meaning of the token matches the terminal: return it
                 return m
         # No meaning of the token matches this terminal: return False
@@ -1719,6 +1962,38 @@ class VariantHandler:
         """Return the variant with the given index"""
         return self._vparts[index]
 
+    @property
+    def gender_vbits(self) -> int:
+        """Return the gender bit(s) of this terminal, or 0 if none"""
+        return self._gender_vbits
+
+    @property
+    def verb_form_vbits(self) -> int:
+        """Return the bits of the verb variants of this terminal
+        that must be present in a matching verb form"""
+        return self._verb_form_vbits
+
+    @property
+    def case_vbits(self) -> int:
+        """Return the case bit(s) of this terminal, or 0 if none"""
+        return self._case_vbits
+
+    @property
+    def subject_case(self) -> Optional[str]:
+        """Return the subject case required by an adjective terminal
+        having an _sþf, _sþgf or _sef variant, or None"""
+        return self._subject_case
+
+    @property
+    def lemma_endings(self) -> Tuple[str, ...]:
+        """Return the lemma endings required by _xsomething variants, if any"""
+        return self._lemma_endings
+
+    @property
+    def word_endings(self) -> Tuple[str, ...]:
+        """Return the word form endings required by _zsomething variants, if any"""
+        return self._word_endings
+
     @property
     def verb_cases(self) -> str:
         """Return the verb cases associated with a so_ terminal, or empty string"""
@@ -1726,7 +2001,11 @@ class VariantHandler:
 
     def has_variant(self, v: str) -> bool:
         """Returns True if the terminal name has the given variant"""
-        return v in self._vset
+        bit = _HAS_VARIANT_VBIT.get(v)
+        if bit is None:
+            # Not a variant with its own bit, such as an ending variant
+            return v in self._vset
+        return (self._vbits & bit) != 0
 
     def has_vbits(self, vbits: int) -> bool:
         """Return True if this terminal has (all) the variant(s)
@@ -1753,90 +2032,6 @@ class VariantHandler:
         """Return True if the given fbits meet the variant criteria after masking"""
         return (self._fbits & mask & ~fbits) == 0
 
-    @property
-    def gender(self) -> Optional[str]:
-        """Return a gender string corresponding to a variant
-        of this terminal, if any"""
-        if self._vbits & BIN_Token.VBIT_KK:
-            return "kk"
-        if self._vbits & BIN_Token.VBIT_KVK:
-            return "kvk"
-        if self._vbits & BIN_Token.VBIT_HK:
-            return "hk"
-        return None
-
-    @property
-    def case(self) -> Optional[str]:
-        """Return a case string corresponding to a variant
-        of this terminal, if any"""
-        if self._vbits & BIN_Token.VBIT_NF:
-            return "nf"
-        if self._vbits & BIN_Token.VBIT_ÞF:
-            return "þf"
-        if self._vbits & BIN_Token.VBIT_ÞGF:
-            return "þgf"
-        if self._vbits & BIN_Token.VBIT_EF:
-            return "ef"
-        return None
-
-    @property
-    def is_singular(self) -> bool:
-        return (self._vbits & BIN_Token.VBIT_ET) != 0
-
-    @property
-    def is_plural(self) -> bool:
-        return (self._vbits & BIN_Token.VBIT_FT) != 0
-
-    @property
-    def is_abbrev(self) -> bool:
-        return (self._vbits & BIN_Token.VBIT_ABBREV) != 0
-
-    @property
-    def is_nh(self) -> bool:
-        return (self._vbits & BIN_Token.VBIT_NH) != 0
-
-    @property
-    def is_mm(self) -> bool:
-        return (self._vbits & BIN_Token.VBIT_MM) != 0
-
-    @property
-    def is_gm(self) -> bool:
-        return (self._vbits & BIN_Token.VBIT_GM) != 0
-
-    @property
-    def is_subj(self) -> bool:
-        return (self._vbits & BIN_Token.VBIT_SUBJ) != 0
-
-    @property
-    def is_sagnb(self) -> bool:
-        return (self._vbits & BIN_Token.VBIT_SAGNB) != 0
-
-    @property
-    def is_op(self) -> bool:
-        return (self._vbits & BIN_Token.VBIT_OP) != 0
-
-    @property
-    def is_lh(self) -> bool:
-        # Lýsingarháttur þátíðar ("LHÞT")
-        return (self._vbits & BIN_Token.VBIT_LH) != 0
-
-    @property
-    def is_lh_nt(self) -> bool:
-        # Lýsingarháttur nútíðar ("LH-NT" or "LHNT")
-        return (self._vbits & BIN_Token.VBIT_LHNT) == BIN_Token.VBIT_LHNT
-
-    @property
-    def is_vh(self) -> bool:
-        return (self._vbits & BIN_Token.VBIT_VH) != 0
-
-    @property
-    def is_bh(self) -> bool:
-        return (self._vbits & BIN_Token.VBIT_BH) != 0
-
-    @property
-    def is_expl(self) -> bool:
-        return (self._vbits & BIN_Token.VBIT_EXPL) != 0
-
 
 class BIN_Terminal(VariantHandler, Terminal):
     """Subclass of Terminal that mixes in support from VariantHandler
@@ -1857,8 +2052,9 @@ class SequenceTerminal(BIN_Terminal):
     types."""
 
     # A sequence terminal matches integers, a,b,c...,aa,ab,ac...,
-    # as well as roman numerals
-    _REGEX = re.compile(r"(?:[0-9]+$)|(?:[a-z]{1,2}$)|(?:[ivxlcm]+$)")
+    # as well as roman numerals. The fullmatch method is bound once here
+    # to avoid repeated attribute lookups when matching.
+    _FULLMATCH = re.compile(r"[0-9]+|[a-z]{1,2}|[ivxlcm]+").fullmatch
 
     def __init__(self) -> None:
         super().__init__("sequence")
@@ -1870,7 +2066,14 @@ class SequenceTerminal(BIN_Terminal):
     def _match(token_txt: str) -> bool:
         """Return True if the given (lower case) token text matches a
         sequence, i.e. is a number, a,b,c..., or i,ii,iii..."""
-        return SequenceTerminal._REGEX.match(token_txt) is not None
+        return SequenceTerminal._FULLMATCH(token_txt) is not None
+
+
+def _shortcut_literal_cat(first: str, t_lit: str) -> Optional[bool]:
+    """Shortcut match for a literal terminal with a category specification:
+    return False if the token text differs from the literal, or None
+    (no shortcut) if it is the same"""
+    return False if first != t_lit else None
 
 
 class BIN_LiteralTerminal(VariantHandler, LiteralTerminal):
@@ -1936,10 +2139,9 @@ class BIN_LiteralTerminal(VariantHandler, LiteralTerminal):
             if self._cat is None or self._match_cat == "punctuation":
                 # Fot literal terminals with no category specification,
                 # i.e. "hvenær", we simply match on the token text without further ado
-                func1: Callable[[str], Optional[bool]] = (
-                    lambda t_lit: self._first == t_lit
-                )
-                self.shortcut_match = func1
+                # The bound __eq__ method of the literal string does this
+                # without a Python-level call frame
+                self.shortcut_match = self._first.__eq__
             else:
                 # For literal terminals with a category specification,
                 # i.e. "hvenær:ao", we shortcut the match, returning False, if the
@@ -1948,10 +2150,7 @@ class BIN_LiteralTerminal(VariantHandler, LiteralTerminal):
                 # will be called, which again calls BIN_LiteralTerminal.matches()
                 # for each possible meaning of the word (since we want to select a
                 # meaning that fits the specified category).
-                func2: Callable[[str], Optional[bool]] = lambda t_lit: (
-                    False if self._first != t_lit else None
-                )
-                self.shortcut_match = func2
+                self.shortcut_match = partial(_shortcut_literal_cat, self._first)
         else:
             # For lemma terminals, the matches_first() and matches()
             # functions are identical
@@ -2037,7 +2236,8 @@ class BIN_Nonterminal(Nonterminal):
         super().__init__(name, fname, line)
         # Optimized check for whether this is a noun phrase nonterminal
         self._is_noun_phrase = name.startswith("Nl")
-        self._parts: Optional[List[str]] = None
+        # The initial part (before any underscores) of the nonterminal name
+        self._first = name.split("_", 1)[0]
 
     @property
     def is_noun_phrase(self) -> bool:
@@ -2048,10 +2248,7 @@ class BIN_Nonterminal(Nonterminal):
     def first(self) -> str:
         """Return the initial part (before any underscores)
         of the nonterminal name"""
-        # Do this on demand
-        if self._parts is None:
-            self._parts = self.name.split("_")
-        return self._parts[0]
+        return self._first
 
 
 class BIN_Grammar(Grammar):
@@ -2095,6 +2292,10 @@ class BIN_Parser(Base_Parser):
     _grammar: Optional[BIN_Grammar] = None
     _grammar_ts: Optional[float] = None
     _grammar_class: Type[BIN_Grammar] = BIN_Grammar
+    # Monotonic time of the last check of the grammar file timestamp
+    _grammar_check_time: float = 0.0
+    # Minimum interval between checks of the grammar file timestamp, in seconds
+    _GRAMMAR_CHECK_INTERVAL = 1.0
 
     _GRAMMAR_NAME = "Greynir.grammar"
     _GRAMMAR_FILE = os.path.join(_PATH, _GRAMMAR_NAME)
@@ -2108,7 +2309,7 @@ class BIN_Parser(Base_Parser):
 
     def __init__(self, verbose: bool = False) -> None:
         super().__init__()
-        modified, ts = self.is_grammar_modified()
+        modified, ts = self._is_grammar_modified_throttled()
         if modified:
             # Grammar not loaded, or its timestamp has changed: load it
             g = self._load_grammar(verbose, ts)
@@ -2129,9 +2330,23 @@ class BIN_Parser(Base_Parser):
             return (True, None)
         # If we have a grammar, check whether the timestamp is
         # still the same as it was when loaded
+        cls._grammar_check_time = time.monotonic()
         ts = os.path.getmtime(cls._GRAMMAR_FILE)
         return (cls._grammar_ts != ts, ts)
 
+    @classmethod
+    def _is_grammar_modified_throttled(cls) -> Tuple[bool, Optional[float]]:
+        """Same as is_grammar_modified(), except that if the grammar file
+        was checked very recently, it is assumed to be unmodified. This
+        saves a file system call for each parser constructed in quick
+        succession, at the cost of noticing grammar file changes up to
+        _GRAMMAR_CHECK_INTERVAL seconds late."""
+        if cls._grammar_ts is not None and (
+            time.monotonic() - cls._grammar_check_time < cls._GRAMMAR_CHECK_INTERVAL
+        ):
+            return (False, cls._grammar_ts)
+        return cls.is_grammar_modified()
+
     @classmethod
     def _load_grammar(cls, verbose: bool, ts: Optional[float]) -> BIN_Grammar:
         """Load the shared BIN grammar if not already there"""
@@ -2150,6 +2365,7 @@ class BIN_Parser(Base_Parser):
         )
         cls._grammar = g
         cls._grammar_ts = ts
+        cls._grammar_check_time = time.monotonic()
         if Settings.DEBUG:
             print(
                 "Grammar parsed and loaded in {0:.2f} seconds".format(time.time() - t0)
@@ -2200,73 +2416,66 @@ def wrap_tokens(
     text within parentheses. The function returns a fresh token list, with
     each token eventually processed through the wrap_func given, if any."""
 
-    # Remove stuff that won't be understood in any case
-    # Start with runs of unknown words inside parentheses
-    tlist: List[Optional[Tok]] = list(tokens)
-    tlen = len(tlist)
-
-    def scan_par(left: int) -> int:
-        """Scan tokens inside parentheses and remove'em all
-        if they are only unknown words - perhaps starting with
-        an abbreviation"""
-        right = left + 1
-        balance = 0
-        while right < tlen:
-            tok = tlist[right]
-            if tok is not None and tok[0] == TOK.PUNCTUATION:
+    def is_unknown(t: Tok) -> bool:
+        """A token is unknown if it is a TOK.UNKNOWN or if it is a
+        TOK.WORD with no meanings"""
+        return (
+            t[0] == TOK.UNKNOWN or (t[0] == TOK.WORD and not t[2]) or t[1] in _UNKNOWN
+        )
+
+    # Remove stuff that won't be understood in any case, in a single pass
+    # over the token stream. Runs of unknown words inside parentheses are
+    # removed, including the parentheses themselves - as well as parentheses
+    # starting with "e." (English). Tokens are collected in kept, along with
+    # their original indices; when an open parenthesis is encountered, its
+    # position in kept is noted so that its contents can be truncated away
+    # once the matching close parenthesis is found.
+    kept: List[Tuple[int, Tok]] = []
+    left = -1  # Position in kept of the open parenthesis, or -1 if none
+    balance = 0  # Nesting level of parentheses within the open one
+    empty = True  # No tokens yet within the open parenthesis
+    foreign = False  # The parenthesis starts with "e."
+    all_unknown = True  # All tokens within the parenthesis are unknown
+    for ix, tok in enumerate(tokens):
+        is_punct = tok[0] == TOK.PUNCTUATION
+        if left < 0:
+            if is_punct and tok[1] == "(":
+                # Start of a parenthesis: note where it is
+                left = len(kept)
+                balance = 0
+                empty = True
+                foreign = False
+                all_unknown = True
+        elif is_punct and tok[1] == ")" and balance == 0:
+            # Matching close parenthesis
+            if foreign or all_unknown:
+                # Only unknown tokens: erase'em, including the parentheses
+                del kept[left:]
+                left = -1
+                continue
+            left = -1
+        else:
+            # Token within the parenthesis
+            if is_punct:
                 # Handle nested parentheses
                 if tok[1] == "(":
                     balance += 1
-                elif tok[1] == ")" and balance > 0:
-                    balance -= 1
                 elif tok[1] == ")":
-                    # Check the contents of the token list from left+1 to right-1
-
-                    # Skip parentheses starting with "e." (English)
-                    foreign = False
-                    if right > left + 1:
-                        next_t = tlist[left + 1]
-                        if next_t is not None:
-                            foreign = next_t[1] in _SKIP_PARENTHESIS
-
-                    def is_unknown(t: Optional[Tok]) -> bool:
-                        """A token is unknown if it is a TOK.UNKNOWN or if it is a
-                        TOK.WORD with no meanings"""
-                        if t is None:
-                            return False
-                        return (
-                            t[0] == TOK.UNKNOWN
-                            or (t[0] == TOK.WORD and not t[2])
-                            or t[1] in _UNKNOWN
-                        )
-
-                    if foreign or all(is_unknown(t) for t in tlist[left + 1 : right]):
-                        # Only unknown tokens: erase'em, including the parentheses
-                        for i in range(left, right + 1):
-                            tlist[i] = None
-
-                    return right + 1
-
-            right += 1
-        # No match: we're done
-        return right
-
-    # Remove embedded parentheses with unknown content
-    ix = 0
-    while ix < tlen:
-        tok = tlist[ix]
-        if tok and tok[0] == TOK.PUNCTUATION and tok[1] == "(":
-            ix = scan_par(ix)  # Jumps to the right parenthesis, if found
-        else:
-            ix += 1
+                    balance -= 1
+            if empty:
+                foreign = tok[1] in _SKIP_PARENTHESIS
+                empty = False
+            if all_unknown and not is_unknown(tok):
+                all_unknown = False
+        kept.append((ix, tok))
+    # Note that if an open parenthesis is never closed, it and all tokens
+    # following it are left untouched
 
     # Wrap the sanitized token list using wrap_func, if given,
     # while keeping a back index to the original token
     wrapped_tokens: List[_T] = []
-    for ix, t in enumerate(tlist):
-        if t is not None and BIN_Token.is_understood(
-            t, understood_punctuation=understood_punctuation
-        ):
+    for ix, t in kept:
+        if BIN_Token.is_understood(t, understood_punctuation=understood_punctuation):
             wrapped_tokens.append(
                 cast(_T, t) if wrap_func is None else wrap_func(t, ix)
             )
@@ -2344,10 +2553,20 @@ _PFN_VARIANTS = {
     "þeirra": {"p3"},  # Gender unknown
 }
 
+# Terminal categories for which the BÍN inflection string is not significant
+_AUGMENT_SKIP_BIN = frozenset(("fs", "sérnafn", "fyrirtæki"))
+_NUMBER_VARIANTS = frozenset(("et", "ft"))
+_PERSON_VARIANTS = frozenset(("p1", "p2", "p3"))
+_LH_ÞT_VARIANTS = frozenset(("lh", "þt"))
+_NO_VARIANTS: FrozenSet[str] = frozenset()
+
 
+@lru_cache(maxsize=16384)
 def augment_terminal(terminal: str, text_lower: str, beyging: str) -> str:
     """Augment a terminal name string with additional variants from BÍN,
-    extracted from the 'beyging' string"""
+    extracted from the 'beyging' string. The same combinations of
+    terminal and inflection recur frequently within a text, so the
+    results are cached."""
     a = terminal.split("_")
     cases = []
     vstart = 1
@@ -2370,9 +2589,12 @@ def augment_terminal(terminal: str, text_lower: str, beyging: str) -> str:
     if a[0] == "pfn":
         # For personal pronouns, BÍN is missing gender and person information
         # Add it here for completeness
-        vset |= _PFN_VARIANTS.get(text_lower, set())
+        vset |= _PFN_VARIANTS.get(text_lower, _NO_VARIANTS)
     # Collect the variants from the terminal and from the BÍN 'beyging' string
-    if a[0] not in {"fs", "sérnafn", "fyrirtæki"}:
+    # An empty beyging string has no variants to add. Note that the rest of
+    # this function must still run in that case, since it also normalizes
+    # the variants that come from the terminal name itself.
+    if beyging and a[0] not in _AUGMENT_SKIP_BIN:
         # For prepositions, the beyging string is not significant and
         # may contain junk, if the same word form (such as 'á') is found in BÍN.
         # See comment in matcher_fs() within the WordMatchers class.
@@ -2383,7 +2605,7 @@ def augment_terminal(terminal: str, text_lower: str, beyging: str) -> str:
         vset |= BIN_Token.bin_variants(beyging)
     if a[0] == "gata":
         # No need for number specifier for street names
-        vset -= {"et", "ft"}
+        vset -= _NUMBER_VARIANTS
     # Additional hygiene to make sure we don't have both _esb and _sb / _evb and _vb
     if "esb" in vset and "sb" in vset:
         vset.remove("sb")
@@ -2392,13 +2614,70 @@ def augment_terminal(terminal: str, text_lower: str, beyging: str) -> str:
     elif "op" in vset:
         # For impersonal verbs, all three persons are identical
         # and not required
-        vset -= {"p1", "p2", "p3"}
+        vset -= _PERSON_VARIANTS
     elif "lh" in vset and "þt" in vset:
         # Change _lh_þt to _lhþt
-        vset -= {"lh", "þt"}
+        vset -= _LH_ÞT_VARIANTS
         vset.add("lhþt")
     vset -= vset_remove
-    return "_".join(a[0:1] + cases + sorted(list(vset)))
+    parts = [a[0]]
+    parts.extend(cases)
+    parts.extend(sorted(vset))
+    return "_".join(parts)
+
+
+def _flatten_amount(val: Any) -> Any:
+    """Flatten and simplify amounts"""
+    return {"amount": val[0], "currency": val[1]}
+
+
+def _flatten_measurement(val: Any) -> Any:
+    """Flatten and simplify measurements"""
+    return {"unit": val[0], "value": val[1]}
+
+
+def _flatten_date(val: Any) -> Any:
+    """Flatten and simplify dates"""
+    return {"y": val[0], "mo": val[1], "d": val[2]}
+
+
+def _flatten_time(val: Any) -> Any:
+    """Flatten and simplify times"""
+    return {"h": val[0], "m": val[1], "s": val[2]}
+
+
+def _flatten_timestamp(val: Any) -> Any:
+    """Flatten and simplify timestamps"""
+    return {
+        "y": val[0],
+        "mo": val[1],
+        "d": val[2],
+        "h": val[3],
+        "m": val[4],
+        "s": val[5],
+    }
+
+
+# Functions that flatten and simplify the val field of tokens
+# in canonicalize_token(), by token kind
+_VALUE_FLATTENERS: Mapping[int, Callable[[Any], Any]] = {
+    TOK.AMOUNT: _flatten_amount,
+    TOK.MEASUREMENT: _flatten_measurement,
+    # Number, ISO currency code, percentage
+    TOK.NUMBER: itemgetter(0),
+    TOK.CURRENCY: itemgetter(0),
+    TOK.PERCENT: itemgetter(0),
+    TOK.DATE: _flatten_date,
+    TOK.DATEREL: _flatten_date,
+    TOK.DATEABS: _flatten_date,
+    TOK.TIME: _flatten_time,
+    TOK.TIMESTAMP: _flatten_timestamp,
+    TOK.TIMESTAMPREL: _flatten_timestamp,
+    TOK.TIMESTAMPABS: _flatten_timestamp,
+}
+
+# Token kinds that get their text as a stem if they have none
+_STEM_KINDS = frozenset((TOK.ENTITY, TOK.WORD))
 
 
 def canonicalize_token(source: TokenDict) -> CanonicalTokenDict:
@@ -2411,20 +2690,17 @@ def canonicalize_token(source: TokenDict) -> CanonicalTokenDict:
     # Set the token kind to a readable string
     kind = source.get("k", TOK.WORD)
     t["k"] = TOK.descr[kind]
-    if "t" in t:
+    orig_t: Optional[str] = t.get("t")
+    m = cast(TokenDict, t).pop("m", None)
+    if orig_t is not None:
         # Use category from "m" (BÍN meaning) field if present, otherwise None
-        orig_t: str = t["t"]
-        new_t: str = simplify_terminal(
-            orig_t, source["m"][1] if "m" in source else None
-        )
+        new_t: str = simplify_terminal(orig_t, m[1] if m is not None else None)
         if new_t != orig_t:
             # The terminal name was simplified: keep the original one in the "o" field
             t["o"] = orig_t
             t["t"] = new_t
-    if "m" in source:
+    if m is not None:
         # Flatten the meaning from a tuple/list
-        m = source["m"]
-        del cast(TokenDict, t)["m"]
         # s = stofn (lemma)
         # c = ordfl (category)
         # f = fl (class)
@@ -2437,7 +2713,9 @@ def canonicalize_token(source: TokenDict) -> CanonicalTokenDict:
         t["c"] = m[1]
         t["f"] = fl
         t["b"] = m[3]
-    if "t" in t and "b" in t:
+    # Note that the "b" field is normally only present if it was
+    # filled in from the "m" field above
+    if orig_t is not None and (m is not None or "b" in t):
         # This is a terminal that may have additional information
         # about itself in the 'b' (beyging) field from BÍN.
         # Add an 'a' field with a terminal name including all
@@ -2446,36 +2724,26 @@ def canonicalize_token(source: TokenDict) -> CanonicalTokenDict:
         t["a"] = augment_terminal(t["t"], t["x"].lower(), t["b"])
     if "v" in t:
         # Flatten and simplify the val field, if present
-        val = cast(Any, t["v"])
-        if kind == TOK.AMOUNT:
-            # Flatten and simplify amounts
-            t["v"] = dict(amount=val[0], currency=val[1])
-        elif kind == TOK.MEASUREMENT:
-            # Flatten and simplify measurements
-            t["v"] = dict(unit=val[0], value=val[1])
-        elif kind in {TOK.NUMBER, TOK.CURRENCY, TOK.PERCENT}:
-            # Number, ISO currency code, percentage
-            t["v"] = val[0]
-        elif kind in {TOK.DATE, TOK.DATEREL, TOK.DATEABS}:
-            t["v"] = dict(y=val[0], mo=val[1], d=val[2])
-        elif kind == TOK.TIME:
-            t["v"] = dict(h=val[0], m=val[1], s=val[2])
-        elif kind in {TOK.TIMESTAMP, TOK.TIMESTAMPREL, TOK.TIMESTAMPABS}:
-            t["v"] = dict(y=val[0], mo=val[1], d=val[2], h=val[3], m=val[4], s=val[5])
+        flatten = _VALUE_FLATTENERS.get(kind)
+        if flatten is not None:
+            t["v"] = flatten(t["v"])
         elif kind == TOK.PERSON:
             # Move the nominal form of the name to the "s" (stem) field
-            t["s"] = cast(str, t["v"])
-            del cast(TokenDict, t)["v"]
+            t["s"] = cast(str, t.pop("v"))
             # Move the gender to the "c" (category) field
-            if "g" in t:
-                t["c"] = cast(TokenDict, t)["g"]
-                del cast(TokenDict, t)["g"]
-    if kind in (TOK.ENTITY, TOK.WORD) and "s" not in t:
-        # Put in a stem for entities and proper names
-        t["s"] = t["x"]
+            gender = cast(TokenDict, t).pop("g", None)
+            if gender is not None:
+                t["c"] = gender
+    if kind in _STEM_KINDS:
+        # Put in a stem for entities and proper names, if not already there
+        t.setdefault("s", t["x"])
     return t  # type: ignore
 
 
+# Token kinds whose val field is not included in describe_token() output
+_NO_VAL_KINDS = frozenset((TOK.WORD, TOK.ENTITY, TOK.PUNCTUATION))
+
+
 def describe_token(
     index: int, t: Tok, terminal: Optional[BIN_Terminal], meaning: Optional[BIN_Tuple]
 ) -> TokenDict:
@@ -2511,7 +2779,7 @@ def describe_token(
     if t.kind != TOK.WORD:
         # Optimize by only storing the k field for non-word tokens
         d["k"] = t.kind
-    if t.val is not None and t.kind not in {TOK.WORD, TOK.ENTITY, TOK.PUNCTUATION}:
+    if t.val is not None and t.kind not in _NO_VAL_KINDS:
         # For tokens except words, entities and punctuation, include the val field
         if t.kind == TOK.PERSON:
             case: Optional[str] = None
@@ -75,6 +75,7 @@ from typing import (
 
 import os
 import operator
+import time
 from threading import Lock
 from functools import reduce
 
@@ -653,15 +654,28 @@ class Fast_Parser(BIN_Parser):
     _c_grammar: Any = ffi_NULL
     # The C++ grammar timestamp
     _c_grammar_ts: Optional[float] = None
+    # Monotonic time of the last check of the binary grammar file timestamp
+    _c_grammar_check_time: float = 0.0
 
     @classmethod
-    def _load_binary_grammar(cls) -> Any:
-        """Load the binary grammar file into memory, if required"""
+    def _load_binary_grammar(cls, force_check: bool = False) -> Any:
+        """Load the binary grammar file into memory, if required.
+        As with the text grammar, the file timestamp is not checked again
+        within _GRAMMAR_CHECK_INTERVAL seconds of the previous check,
+        unless force_check is True."""
+        if (
+            not force_check
+            and cls._c_grammar != ffi_NULL
+            and time.monotonic() - cls._c_grammar_check_time
+            < cls._GRAMMAR_CHECK_INTERVAL
+        ):
+            return cls._c_grammar
         fname = cls._GRAMMAR_BINARY_FILE
         try:
             ts = os.path.getmtime(fname)
         except os.error:
             raise GrammarError("Binary grammar file {0} not found".format(fname))
+        cls._c_grammar_check_time = time.monotonic()
         if cls._c_grammar == ffi_NULL or cls._c_grammar_ts != ts:
             # Need to load or reload the grammar
             if cls._c_grammar != ffi_NULL:
@@ -683,9 +697,14 @@ class Fast_Parser(BIN_Parser):
         # vs. writing the binary grammar
         with GlobalLock("grammar"):
             # Read and parse the grammar text file
+            prev_grammar = self._grammar
             super().__init__(verbose)
-            # Create instances of the C++ Grammar and Parser classes
-            c_grammar = self._load_binary_grammar()
+            # Create instances of the C++ Grammar and Parser classes.
+            # If the text grammar was just (re)loaded, the binary grammar
+            # may have been rewritten, so its timestamp must be checked.
+            c_grammar = self._load_binary_grammar(
+                force_check=self._grammar is not prev_grammar
+            )
             # Create a C++ parser object for the grammar, passing the proxies for the
             # two Python callback functions into it
             self._c_parser: Any = eparser.newParser(  # type: ignore
@@ -795,6 +814,7 @@ class Fast_Parser(BIN_Parser):
             eparser.deleteGrammar(cls._c_grammar)  # type: ignore
         cls._c_grammar = ffi_NULL
         cls._c_grammar_ts = None
+        cls._c_grammar_check_time = 0.0
 
     @classmethod
     def num_combinations(cls, forest: Node) -> int:
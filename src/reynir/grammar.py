@@ -351,6 +351,8 @@ class Token:
 
     """A single input token as seen by the parser"""
 
+    __slots__ = ("_kind", "_val", "_lit")
+
     def __init__(self, kind: str, val: str, lit: Optional[str] = None) -> None:
         """A basic token has a kind, a canonical value
         and an optional literal value, all strings"""
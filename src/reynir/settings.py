@@ -123,7 +123,7 @@ class VerbSubjects:
         """Returns True if the given verb is only impersonal, i.e. if it appears
         with an $error() pragma in the subject = nf section of verb_subjects
         and cannot be used with a nominative subject: ?'ég dreymdi þig'"""
-        return "nf" in VerbSubjects.VERBS_ERRORS.get(verb, dict())
+        return "nf" in VerbSubjects.VERBS_ERRORS.get(verb, ())
 
 
 class Prepositions:
@@ -33,9 +33,11 @@
 
 import pytest
 
-from tokenizer.definitions import AmountTuple, DateTimeTuple
+from tokenizer import TOK, Tok
+from tokenizer.definitions import AmountTuple, BIN_Tuple, DateTimeTuple
 
 from reynir import Greynir
+from reynir.binparser import BIN_Terminal, BIN_Token, WordMatchers
 from reynir.reynir import Terminal
 
 
@@ -143,3 +145,142 @@ def test_matcher(r: Greynir, verbose: bool = False) -> None:
         )
     )
     assert len(m) == 0
+
+
+def test_fbits_and_variants() -> None:
+    """Check the variant bits and variant sets that are extracted
+    from representative BÍN inflection strings (beyging)"""
+
+    def fbits(*names: str) -> int:
+        b = 0
+        for name in names:
+            b |= BIN_Token.FBIT[name]
+        return b
+
+    cases = [
+        (
+            "GM-FH-NT-3P-ET",
+            fbits("GM", "FH", "NT", "3P", "ET"),
+            {"gm", "fh", "nt", "p3", "et"},
+        ),
+        ("MM-SAGNB", fbits("MM", "SAGNB"), {"mm", "sagnb"}),
+        ("NFETgr", fbits("NF", "ET", "gr"), {"nf", "et", "gr"}),
+        ("FVB-KK-NFET", fbits("VB", "KK", "NF", "ET"), {"vb", "kk", "nf", "et"}),
+        (
+            "LHÞT-SB-KK-NFET",
+            fbits("LHÞT", "LH", "SB", "KK", "NF", "ET"),
+            {"lhþt", "sb", "kk", "nf", "et"},
+        ),
+        (
+            "OP-það-GM-FH-NT-3P-ET",
+            fbits("OP", "það", "GM", "FH", "NT", "3P", "ET"),
+            {"op", "expl", "gm", "fh", "nt", "et"},
+        ),
+        (
+            "OP-GM-FH-ÞT-3P-FT",
+            fbits("OP", "GM", "FH", "3P", "FT"),
+            {"op", "gm", "fh", "þt", "ft"},
+        ),
+        ("GM-BH-ST", fbits("GM", "BH"), {"gm", "bh"}),
+        (
+            "ESB-HK-NFET",
+            fbits("ESB", "SB", "HK", "NF", "ET"),
+            {"esb", "hk", "nf", "et"},
+        ),
+        ("-", 0, set()),
+        ("", 0, set()),
+    ]
+    for beyging, expected_fbits, expected_variants in cases:
+        assert BIN_Token.get_fbits(beyging) == expected_fbits, beyging
+        assert BIN_Token.bin_variants(beyging) == expected_variants, beyging
+        # The results are cached: a second lookup must give the same answer
+        assert BIN_Token.get_fbits(beyging) == expected_fbits, beyging
+        assert BIN_Token.bin_variants(beyging) == expected_variants, beyging
+
+
+def test_verb_matches(r: Greynir) -> None:
+    """Check verb forms against verb terminals, including the variants
+    that are encoded in the form (lhþt, sagnb, mm, op, það)"""
+
+    def vm(verb: str, terminal: str, form: str) -> bool:
+        return BIN_Token.verb_matches(verb, BIN_Terminal(terminal), form)
+
+    # Past participle (lýsingarháttur þátíðar)
+    assert vm("borða", "so_0_lhþt_sb_kk_nf_et", "LHÞT-SB-KK-NFET")
+    assert vm("borða", "so_lhþt_sb_kk_nf_et", "LHÞT-SB-KK-NFET")
+    assert not vm("borða", "so_0_p3_et", "LHÞT-SB-KK-NFET")
+    # Weak declension of lhþt only if explicitly requested
+    assert not vm("borða", "so_0_lhþt_sb_kk_nf_et", "LHÞT-VB-KK-NFET")
+    assert vm("borða", "so_0_lhþt_vb_kk_nf_et", "LHÞT-VB-KK-NFET")
+    # Supine (sagnbót) is a restrictive variant
+    assert vm("borða", "so_1_þf_sagnb", "GM-SAGNB")
+    assert vm("borða", "so_0_sagnb", "GM-SAGNB")
+    assert not vm("borða", "so_1_þf_p3_et", "GM-SAGNB")
+    # Person, number and argument checks
+    assert vm("borða", "so_1_þf_gm_fh_nt_p3_et", "GM-FH-NT-3P-ET")
+    assert vm("borða", "so_1_þf_fh_nt_p3_et", "GM-FH-NT-3P-ET")
+    assert not vm("borða", "so_1_þf_fh_nt_p3_ft", "GM-FH-NT-3P-ET")
+    assert not vm("borða", "so_1_þf_fh_nt_p1_et", "GM-FH-NT-3P-ET")
+    assert not vm("borða", "so_2_þf_þgf_fh_nt_p3_et", "GM-FH-NT-3P-ET")
+    # Imperative (boðháttur), but not the truncated form (stýfður)
+    assert vm("borða", "so_0_bh", "GM-BH-ET")
+    assert not vm("borða", "so_0_bh", "GM-BH-ST")
+    # Middle voice (miðmynd)
+    assert vm("eigna", "so_1_þf_mm_fh_þt_p3_et", "MM-FH-ÞT-3P-ET")
+    assert vm("eigna", "so_1_þf_mm_sagnb", "MM-SAGNB")
+    # Impersonal verbs with an oblique subject
+    assert vm("langa", "so_subj_op_þf", "OP-GM-FH-NT-3P-ET")
+    assert not vm("langa", "so_subj_op_þgf", "OP-GM-FH-NT-3P-ET")
+    assert not vm("langa", "so_0_p3_et", "OP-GM-FH-NT-3P-ET")
+    assert not vm("langa", "so_subj_op_þf", "OP-það-GM-FH-NT-3P-ET")
+    assert vm("vanta", "so_1_þf_subj_op_þf", "OP-GM-FH-NT-3P-ET")
+    assert vm("vanta", "so_subj_op_sagnb_þf", "OP-GM-SAGNB")
+    assert not vm("vanta", "so_subj_op_þf", "OP-GM-SAGNB")
+    # Impersonal forms with an expletive 'það' subject
+    assert vm("rigna", "so_0_op_expl_p3_et", "OP-það-GM-FH-ÞT-3P-ET")
+    assert vm("rigna", "so_1_þgf_op_expl_p3_et", "OP-það-GM-FH-ÞT-3P-ET")
+    assert not vm("rigna", "so_0_op_p3_et", "OP-það-GM-FH-ÞT-3P-ET")
+    assert not vm("rigna", "so_0_op_expl_p3_et", "OP-GM-FH-ÞT-3P-ET")
+
+
+def test_matcher_no() -> None:
+    """Check the matching of noun meanings with noun terminals"""
+
+    def no(terminal: str, m: BIN_Tuple) -> bool:
+        token = BIN_Token(Tok(TOK.WORD, m.ordmynd, [m]), 0)
+        return WordMatchers.matcher_no(token, BIN_Terminal(terminal), m)
+
+    def hestur(beyging: str) -> BIN_Tuple:
+        return BIN_Tuple("hestur", 1, "kk", "alm", "hestur", beyging)
+
+    def kona(beyging: str) -> BIN_Tuple:
+        return BIN_Tuple("kona", 2, "kvk", "alm", "kona", beyging)
+
+    # Case, number and definite article
+    assert no("no_et_nf_kk", hestur("NFET"))
+    assert no("no_et_nf_kk", hestur("NFETgr"))
+    assert not no("no_et_nf_kk_gr", hestur("NFET"))
+    assert no("no_et_nf_kk_gr", hestur("NFETgr"))
+    assert not no("no_et_þf_kk", hestur("NFET"))
+    assert not no("no_ft_nf_kk", hestur("NFET"))
+    assert no("no_ft_ef_kvk_gr", kona("EFFTgr"))
+    # Gender
+    assert not no("no_et_nf_kvk", hestur("NFET"))
+    assert no("no_et_nf_kvk", kona("NFET"))
+    assert no("no_et_nf", kona("NFET"))
+    # No inflection info: all cases and numbers match, but not 'gr'
+    assert no("no_et_nf_kk", hestur("-"))
+    assert no("no_ft_þgf_kk", hestur("-"))
+    assert not no("no_et_nf_kk_gr", hestur("-"))
+    assert not no("no_et_nf_kvk", hestur("-"))
+    # Abbreviations are meanings without inflection info
+    assert no("no_abbrev", hestur("-"))
+    assert not no("no_abbrev", hestur("NFET"))
+    # Lemma endings
+    assert no("no_et_nf_kk_xur", hestur("NFET"))
+    assert not no("no_et_nf_kk_xir", hestur("NFET"))
+    # Word form endings
+    assert no("no_et_nf_kk_zur", hestur("NFET"))
+    assert not no("no_et_nf_kk_zar", hestur("NFET"))
+    # Not a noun
+    assert not no("no_et_nf_kk", BIN_Tuple("sá", 5, "fn", "alm", "sá", "KK-NFET"))
@@ -31,15 +31,18 @@
 
 """
 
-from typing import List, cast
+from typing import List, Tuple, cast
 
+import os
 from collections import defaultdict
 
 import pytest
 
-from tokenizer.definitions import AmountTuple, DateTimeTuple
+from tokenizer import TOK, Tok
+from tokenizer.definitions import AmountTuple, BIN_Tuple, DateTimeTuple
 
 from reynir import Greynir
+from reynir.binparser import wrap_tokens
 from reynir.reynir import Terminal
 
 
@@ -2222,6 +2225,117 @@ def test_aukafall(r):
     assert s and s.tree
 
 
+def test_grammar_modified(r, monkeypatch):
+    """is_grammar_modified() must always check the grammar file,
+    even though parser construction throttles its checks"""
+    from reynir.fastparser import Fast_Parser
+
+    s = r.parse_single("Hér er setning.")
+    assert s and s.tree
+    modified, ts = Fast_Parser.is_grammar_modified()
+    assert not modified
+    assert ts is not None
+    # Make the grammar file appear to have been modified, without
+    # touching the actual file
+    fname = Fast_Parser._GRAMMAR_FILE
+    getmtime = os.path.getmtime
+    monkeypatch.setattr(
+        os.path,
+        "getmtime",
+        lambda path: getmtime(path) + 10.0 if path == fname else getmtime(path),
+    )
+    # Make sure that the throttling interval does not run out during the test
+    monkeypatch.setattr(Fast_Parser, "_GRAMMAR_CHECK_INTERVAL", 3600.0)
+    with Fast_Parser() as fp:
+        grammar = fp.grammar
+    # The explicit check notices the modification immediately...
+    modified, _ = Fast_Parser.is_grammar_modified()
+    assert modified
+    # ...while parser construction does not, since the file was just checked
+    with Fast_Parser() as fp:
+        assert fp.grammar is grammar
+    monkeypatch.undo()
+    modified, _ = Fast_Parser.is_grammar_modified()
+    assert not modified
+
+
+def test_wrap_tokens() -> None:
+    """Check the removal of parenthesized unknown words and insignificant
+    punctuation from the token stream, and that the original token indices
+    are passed to the wrap function"""
+
+    def p(s: str) -> Tok:
+        return Tok(TOK.PUNCTUATION, s, (1, s))
+
+    def w(s: str) -> Tok:
+        # Known word, i.e. with at least one meaning
+        return Tok(TOK.WORD, s, [BIN_Tuple(s, 1, "kk", "alm", s, "NFET")])
+
+    def u(s: str) -> Tok:
+        # Word without meanings
+        return Tok(TOK.WORD, s, [])
+
+    def wrap(toks: List[Tok]) -> List[Tuple[str, int]]:
+        return wrap_tokens(toks, wrap_func=lambda t, ix: (t.txt, ix))
+
+    # A parenthesized run of unknown words is removed
+    assert wrap([w("hestur"), p("("), u("foo"), u("bar"), p(")"), w("köttur")]) == [
+        ("hestur", 0),
+        ("köttur", 5),
+    ]
+    assert wrap([p("("), u("a"), p(")"), w("hestur"), p("("), u("b"), p(")")]) == [
+        ("hestur", 3)
+    ]
+    # ...as are unknown tokens and empty parentheses
+    assert wrap(
+        [w("hestur"), Tok(TOK.UNKNOWN, "xx", None), p("("), p(")"), w("köttur")]
+    ) == [("hestur", 0), ("köttur", 4)]
+    # ...and a foreign phrase marked with 'e.' (enska)
+    assert wrap([w("hestur"), p("("), u("e."), u("horse"), p(")"), p(".")]) == [
+        ("hestur", 0),
+        (".", 5),
+    ]
+    # Parentheses containing known words are kept
+    assert wrap([w("hestur"), p("("), u("foo"), w("köttur"), p(")")]) == [
+        ("hestur", 0),
+        ("(", 1),
+        ("foo", 2),
+        ("köttur", 3),
+        (")", 4),
+    ]
+    # Nested parentheses are left alone
+    assert wrap(
+        [w("hestur"), p("("), u("foo"), p("("), u("bar"), p(")"), p(")"), w("köttur")]
+    ) == [
+        ("hestur", 0),
+        ("(", 1),
+        ("foo", 2),
+        ("(", 3),
+        ("bar", 4),
+        (")", 5),
+        (")", 6),
+        ("köttur", 7),
+    ]
+    # An unclosed parenthesis is left alone
+    assert wrap([w("hestur"), p("("), u("foo"), u("bar")]) == [
+        ("hestur", 0),
+        ("(", 1),
+        ("foo", 2),
+        ("bar", 3),
+    ]
+    assert wrap([w("hestur"), p(")"), u("foo"), w("köttur")]) == [
+        ("hestur", 0),
+        (")", 1),
+        ("foo", 2),
+        ("köttur", 3),
+    ]
+    # Punctuation that is not understood by the parser is removed
+    assert wrap([w("hestur"), p("„"), w("köttur"), p("“"), p("...")]) == [
+        ("hestur", 0),
+        ("köttur", 2),
+    ]
+
+
 if __name__ == "__main__":
     # When invoked as a main module, do a verbose test
     from reynir import Greynir
@@ -2273,4 +2387,6 @@ if __name__ == "__main__":
         print(e)
     test_foreign(g)
     test_aukafall(g)
+    test_grammar_modified(g, pytest.MonkeyPatch())
+    test_wrap_tokens()
     g.__class__.cleanup()
@@ -97,6 +97,87 @@ def test_annotree():
     assert stree.verbs == ["skrá"]
 
 
+def test_canonicalize_token():
+    """Check the exact canonical form, including key order, of the
+    token kinds whose values are flattened into dicts"""
+    from tokenizer import TOK
+
+    from reynir.binparser import canonicalize_token
+
+    cases = [
+        (
+            {"x": "5 kr.", "k": TOK.AMOUNT, "v": (5, "ISK"), "t": "no_kvk_ft_nf"},
+            {
+                "x": "5 kr.",
+                "k": "AMOUNT",
+                "v": {"amount": 5, "currency": "ISK"},
+                "t": "no_kvk_ft_nf",
+            },
+        ),
+        (
+            {"x": "5 m", "k": TOK.MEASUREMENT, "v": ("m", 5.0), "t": "mælieining"},
+            {
+                "x": "5 m",
+                "k": "MEASUREMENT",
+                "v": {"unit": "m", "value": 5.0},
+                "t": "mælieining",
+            },
+        ),
+        (
+            {"x": "1. janúar", "k": TOK.DATEREL, "v": (0, 1, 1), "t": "dagsföst_þf"},
+            {
+                "x": "1. janúar",
+                "k": "DATEREL",
+                "v": {"y": 0, "mo": 1, "d": 1},
+                "t": "dagsföst_þf",
+            },
+        ),
+        (
+            {
+                "x": "1. janúar 2000",
+                "k": TOK.DATEABS,
+                "v": (2000, 1, 1),
+                "t": "dagsafs_nf",
+            },
+            {
+                "x": "1. janúar 2000",
+                "k": "DATEABS",
+                "v": {"y": 2000, "mo": 1, "d": 1},
+                "t": "dagsafs_nf",
+            },
+        ),
+        (
+            {"x": "kl. 5", "k": TOK.TIME, "v": (5, 0, 0), "t": "tími"},
+            {"x": "kl. 5", "k": "TIME", "v": {"h": 5, "m": 0, "s": 0}, "t": "tími"},
+        ),
+        (
+            {
+                "x": "1. janúar 2000 kl. 5",
+                "k": TOK.TIMESTAMPABS,
+                "v": (2000, 1, 1, 5, 0, 0),
+                "t": "tímapunktur",
+            },
+            {
+                "x": "1. janúar 2000 kl. 5",
+                "k": "TIMESTAMPABS",
+                "v": {"y": 2000, "mo": 1, "d": 1, "h": 5, "m": 0, "s": 0},
+                "t": "tímapunktur",
+            },
+        ),
+        (
+            {"x": "Jón", "k": TOK.PERSON, "v": "Jón", "g": "kk", "t": "person_kk_nf"},
+            {"x": "Jón", "k": "PERSON", "t": "person_kk_nf", "s": "Jón", "c": "kk"},
+        ),
+    ]
+    for source, expected in cases:
+        canonical = canonicalize_token(dict(source))
+        assert canonical == expected
+        # The key order is part of the serialized format
+        assert json.dumps(canonical, ensure_ascii=False) == json.dumps(
+            expected, ensure_ascii=False
+        )
+
+
 if __name__ == "__main__":
     # When invoked as a main module, do a verbose test
     from reynir import Greynir